@@ -0,0 +1,128 @@
+"""
+INFO0085-1 - Compilers
+University of Liege
+Academic year 2019-2020
+
+Authors :
+    - Maxime Meurisse
+    - Valentin Vermeylen
+"""
+
+###########
+# Imports #
+###########
+
+import os
+import sys
+import copy
+import multiprocessing
+import concurrent.futures
+
+from server.server import run_captured
+
+
+#############
+# Functions #
+#############
+
+def find_sources(directory):
+    """
+    Returns the paths (sorted) of all the VSOP source files
+    contained in 'directory' (and its subdirectories).
+    """
+
+    sources = []
+
+    for path, subdirectories, files in os.walk(directory):
+        for name in files:
+            if os.path.splitext(name)[1] in ['.vsop', '.vsopext']:
+                sources.append(os.path.join(path, name))
+
+    return sorted(sources)
+
+
+###########
+# Classes #
+###########
+
+class Batch:
+    ###############
+    # Constructor #
+    ###############
+
+    def __init__(self, compile_source, jobs=None):
+        # We save the function used to compile a source file
+        self.compile_source = compile_source
+
+        # We save the number of worker processes (by default,
+        # the number of processors)
+        self.jobs = jobs or os.cpu_count() or 1
+
+    ###########
+    # Compile #
+    ###########
+
+    def run(self, args):
+        """
+        Compiles a single source file (in a worker process) and
+        returns the exit status and the outputs of the compilation.
+        """
+
+        return run_captured(self.compile_source, args)
+
+    def compile(self, args, sources):
+        """
+        Compiles the source files 'sources' with the executable
+        arguments 'args', prints the outputs of each compilation
+        (in the order of the files) followed by a summary, and
+        returns the exit status of the batch.
+        """
+
+        # We create the arguments of each compilation (remark : as
+        # for a single file, the files are compiled as extended VSOP
+        # files only with the '-ext' argument)
+        tasks = []
+
+        for source in sources:
+            task = copy.copy(args)
+            task.source = source
+
+            tasks.append(task)
+
+        # We compile the files with a pool of worker processes (the
+        # workers are forked, so that they do not import the compiler
+        # again, and each worker keeps its loaded modules and tables
+        # for all its files)
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        else:
+            context = None
+
+        jobs = max(1, min(self.jobs, len(tasks)))
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+            results = executor.map(self.run, tasks, chunksize=max(1, len(tasks) // (4 * jobs)))
+
+            # We print the outputs of each compilation
+            statuses = []
+
+            for result in results:
+                sys.stdout.write(result['stdout'])
+                sys.stderr.write(result['stderr'])
+
+                statuses.append(result['status'])
+
+        # We print the summary of the batch (on stderr, so that the
+        # dumps on stdout are not mixed with it)
+        failed = 0
+
+        for source, status in zip(sources, statuses):
+            if status == 0:
+                print('{}: ok'.format(source), file=sys.stderr)
+            else:
+                print('{}: failed (exit status {})'.format(source, status), file=sys.stderr)
+                failed += 1
+
+        print('{} file(s) compiled, {} succeeded, {} failed'.format(len(sources), len(sources) - failed, failed), file=sys.stderr)
+
+        return 1 if failed else 0
@@ -0,0 +1,165 @@
+"""
+INFO0085-1 - Compilers
+University of Liege
+Academic year 2019-2020
+
+Authors :
+    - Maxime Meurisse
+    - Valentin Vermeylen
+"""
+
+###########
+# Imports #
+###########
+
+import os
+import sys
+import hashlib
+import platform
+import tempfile
+
+import llvmlite
+import llvmlite.binding as llvm
+
+
+#############
+# Functions #
+#############
+
+# Version of the compiler (computed once, the first time it is
+# needed)
+compiler_version = None
+
+
+def get_compiler_version():
+    """
+    Returns the version of the compiler, i.e. a hash of all its
+    Python source files (so that any modification of the compiler
+    invalidates the entries of the cache).
+    """
+
+    global compiler_version
+
+    if compiler_version is None:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        h = hashlib.sha256()
+
+        for directory, subdirectories, files in sorted(os.walk(root)):
+            subdirectories.sort()
+
+            for name in sorted(files):
+                # Table modules are generated from the compiler
+                # sources, they do not change the version
+                if not name.endswith('.py') or name.startswith(('lextab', 'parsetab')):
+                    continue
+
+                path = os.path.join(directory, name)
+
+                h.update(os.path.relpath(path, root).encode('utf8'))
+
+                with open(path, 'rb') as f:
+                    h.update(f.read())
+
+        compiler_version = h.hexdigest()
+
+    return compiler_version
+
+
+def get_cache_directory():
+    """
+    Returns the directory of the cache ('$VSOPC_CACHE_DIR' if
+    defined, '~/.cache/vsopc' otherwise).
+    """
+
+    directory = os.environ.get('VSOPC_CACHE_DIR')
+
+    if not directory:
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        directory = os.path.join(cache_home, 'vsopc')
+
+    return directory
+
+
+###########
+# Classes #
+###########
+
+class Cache:
+    """
+    Content-addressed cache of the compilations. An entry is
+    identified by the hash of the source text, of the compilation
+    options (extended VSOP or not, optimization level), of the
+    host and of the versions of the compiler and of LLVM.
+
+    For each entry, the cache contains the (linked and optimized)
+    LLVM IR code, with the extension '.ll', and the object file,
+    with the extension '.o'.
+    """
+
+    ###############
+    # Constructor #
+    ###############
+
+    def __init__(self, source, ext=False, opt_level=0):
+        # We compute the key of the compilation
+        h = hashlib.sha256()
+
+        h.update(get_compiler_version().encode('utf8'))
+        h.update('{}:{}\0'.format(llvmlite.__version__, '.'.join(map(str, llvm.llvm_version_info))).encode('utf8'))
+        h.update('{}:{}:{}:{}\0'.format(sys.platform, platform.machine(), int(ext), opt_level).encode('utf8'))
+
+        h.update(source.data.encode('utf8'))
+
+        self.key = h.hexdigest()
+
+        # We get the directory of the entry
+        self.directory = os.path.join(get_cache_directory(), self.key[:2])
+
+    #################
+    # Use the cache #
+    #################
+
+    def path(self, extension):
+        return os.path.join(self.directory, self.key + extension)
+
+    def load(self, extension):
+        """
+        Returns the content (bytes) of the entry with the
+        extension 'extension', or None if it is not in the
+        cache.
+        """
+
+        try:
+            with open(self.path(extension), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store(self, extension, content):
+        """
+        Stores the content (bytes) of the entry with the
+        extension 'extension'. The cache is only an accelerator,
+        so an entry that can not be written is simply ignored.
+        """
+
+        tmp_path = None
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+
+            # We write a temporary file that is then renamed, so
+            # that a concurrent compilation never reads a partial
+            # entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+
+            os.replace(tmp_path, self.path(extension))
+        except OSError:
+            # We remove the temporary file (if it was created)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
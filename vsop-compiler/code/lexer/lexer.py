@@ -14,6 +14,7 @@ Authors :
 
 import re
 import sys
+import json
 import ply.lex as lex
 
 
@@ -26,16 +27,16 @@ class Lexer:
     # Constructor #
     ###############
 
-    def __init__(self, filename):
-        # We save the filename (to print error)
-        self.filename = filename
+    def __init__(self, source):
+        # We save the source (read once and shared by all the
+        # stages) and its name (to print error)
+        self.source = source
+        self.filename = source.name
 
-        # We get the file content
-        with open(filename, 'r', encoding='ascii') as f:
-            data = f.read()
-
-        # We save the file content (to retrieve column of tokens)
-        self.data = data
+        # We save the source content and the index of its lines
+        # (to retrieve column of tokens)
+        self.data = source.data
+        self.line_index = source.line_index
 
         # We define base tokens
         self.base = (
@@ -118,6 +119,15 @@ class Lexer:
         # Flag to handle the case of a lexing with error(s)
         self.has_error = False
 
+        # Token classes for which we want to display the value
+        self.type_value = ['INTEGER_LITERAL', 'TYPE_IDENTIFIER', 'OBJECT_IDENTIFIER', 'STRING_LITERAL']
+
+        # List of the tokens produced by the lexing (read
+        # afterwards by the parser, so that the source file
+        # is tokenized only once)
+        self.token_list = []
+        self.token_iter = iter(self.token_list)
+
     #######################
     # Comments management #
     #######################
@@ -344,162 +354,199 @@ class Lexer:
         the beginning of the file.
         """
 
-        line_start = self.data.rfind('\n', 0, t.lexpos) + 1
+        return self.line_index.find_column(t.lexpos)
+
+    # Sequences of a string literal (each sequence is processed
+    # as a whole, so that a string is processed in a single scan)
+    string_sequences = re.compile(r"""
+        (?P<plain>[ -\[\]-~]+)                # printable characters
+      | (?P<newline>\\\n[\t\b\r ]*)           # valid newline (with leading whitespaces)
+      | (?P<hex>\\x[0-9a-fA-F]{2})            # hexadecimal escaped sequence
+      | (?P<invalid_hex>\\x[ !#-\[\]-~]{0,2}) # invalid hexadecimal escaped sequence
+      | (?P<escaped>\\[btnr"\\])              # escaped character
+      | (?P<unknown>\\.?)                     # unknow escaped sequence
+      | (?P<raw>.)                            # character that has to be escaped
+    """, re.DOTALL | re.VERBOSE)
 
-        return (t.lexpos - line_start) + 1
+    # Escaped sequences of the escaped characters
+    escaped_chars = {'b': r'\x08', 't': r'\x09', 'n': r'\x0a', 'r': r'\x0d', '"': r'\x22', '\\': r'\x5c'}
 
-    def find_pos_string(self, original, sub):
+    def escape_char(self, char):
         """
-        Returns the line and the column of a
-        substring 'sub' of 'original' relatively
-        to the 'original' string.
+        Returns the escaped sequence of a character
+        (with byte value not in range(32, 127)).
         """
 
-        # We find the position of 'sub' in 'original'
-        original_pos = original.find(sub)
-
-        # We keep the part of the 'original' string up to 'sub'.
-        original_sub = original[0:original_pos + len(sub)]
+        return r'\x{:02x}'.format(ord(char))
 
-        # We get the line position of 'sub' (by counting
-        # the number of '\n' up to 'sub')
-        lineno = original_sub.count('\n')
-
-        # We split the substring of 'original' and keep
-        # the part where 'sub' is located
-        original_split = original_sub.split('\n')
-        original_split = original_split[lineno]
+    def string_error(self, t, pos, message):
+        """
+        Prints an error located at the position 'pos'
+        of the string literal 't'.
+        """
 
-        # We get the column of 'sub'
-        column = original_split.find(sub)
+        lineno, column = self.line_index.find_position(t.lexpos + pos)
 
-        return lineno, column
+        self.print_error(lineno, column, message)
 
     def string_processing(self, t):
         """
         Processes a string literal according to
         the brief (replace valid newline character,
         escaped character and check unknow character).
+
+        The string is processed in a single scan, each
+        error is reported at its exact position.
         """
 
         t.lexer.lineno += t.value.count('\n')
 
-        # We save the original value of the string (for
-        # error reporting)
-        original = t.value
+        # We process each sequence of the string
+        value = []
 
-        # We remove valid newlines if any (a newline
-        # preceded by \) and after that, we check if there
-        # is still a line feed (which could be invalid)
-        t.value = re.sub(r'(\\\n([\t\b\r ])*|\\\n)', '', t.value)
+        for m in self.string_sequences.finditer(t.value):
+            kind, sequence = m.lastgroup, m.group()
 
-        if '\n' in t.value:
-            self.print_error(t.lineno, self.find_column(t) + t.value.find('\n'), 'string contains line feed')
+            # Printable characters are kept
+            if kind == 'plain':
+                value.append(sequence)
 
-        # We check if the treated string contains null character
-        if len(t.value.split('\x00')) != 1:
-            splits = t.value.split('\x00')
-            lineno, column = self.find_pos_string(original, '\x00')
+            # Valid newlines are removed
+            elif kind == 'newline':
+                continue
 
-            self.print_error(t.lineno + lineno, column + 1, 'string contains null character')
+            # Hexadecimal escaped sequence
+            elif kind == 'hex':
+                byte_value = int(sequence[2:], 16)
 
-        # We escape special characters (\b, \t, ect)
-        # and we check if there are characters that
-        # have to be escaped (character with byte
-        # value not in range(32, 127))
-        t.value = t.value.replace(r'\"', r'\x22')
-        t.value = t.value.replace(r'\\', r'\x5c')
+                # Null character (invalid)
+                if byte_value == 0:
+                    self.string_error(t, m.start(), 'string contains null character')
+
+                # We replace the escaped sequence if the
+                # character is printable (exceptions for
+                # \" and \\)
+                if byte_value in range(32, 127) and byte_value not in (0x22, 0x5c):
+                    value.append(chr(byte_value))
+                else:
+                    value.append(sequence)
 
-        t.value = t.value.replace(r'\b', r'\x08')
-        t.value = t.value.replace(r'\t', r'\x09')
-        t.value = t.value.replace(r'\n', r'\x0a')
-        t.value = t.value.replace(r'\r', r'\x0d')
+            elif kind == 'invalid_hex':
+                self.string_error(t, m.start(), 'invalid hexadecimal escaped sequence {}'.format(sequence[2:]))
+                value.append(sequence)
 
-        for char in t.value:
-            c_byte = ord(char)
+            # Escaped characters (\b, \t, ect) are replaced
+            # by their hexadecimal escaped sequence
+            elif kind == 'escaped':
+                value.append(self.escaped_chars[sequence[1]])
 
-            if c_byte not in range(32, 127):
-                c_hex = format(c_byte, 'x')
+            # Not hexadecimal escaped sequence
+            # (necessarily invalid)
+            elif kind == 'unknown':
+                base = sequence[1:]
 
-                if len(c_hex) == 1:
-                    t.value = t.value.replace(char, '\\x0{}'.format(c_hex))
-                else:
-                    t.value = t.value.replace(char, '\\x{}'.format(c_hex))
+                if base and ord(base) not in range(32, 127):
+                    base = self.escape_char(base)
 
-        # Now that all characters are normally escaped,
-        # we iterate over each escaped sequences to check
-        # if there are invalid escaped sequences, null
-        # characters or escaped sequences to replace
-        to_replace = list()
-        escaped = [m.start() for m in re.finditer(r'\\', t.value)]
+                self.string_error(t, m.start(), 'unknow escaped sequence {}'.format(base))
+                value.append('\\' + base)
 
-        for pos in escaped:
-            base = t.value[pos + 1]
+            # Characters with byte value not in range(32, 127)
+            # have to be escaped (line feed and null character
+            # are invalid)
+            else:
+                if sequence == '\n':
+                    self.string_error(t, m.start(), 'string contains line feed')
+                elif sequence == '\x00':
+                    self.string_error(t, m.start(), 'string contains null character')
 
-            # Hexadecimal escaped sequence
-            if base == 'x':
-                hex_value = t.value[pos + 2:pos + 4]
+                value.append(self.escape_char(sequence))
 
-                # Null character (invalid)
-                if hex_value == '00':
-                    lineno, column = self.find_pos_string(original, '\\{}{}'.format(base, hex_value))
+        t.value = ''.join(value)
 
-                    self.print_error(t.lineno + lineno, column + 1, 'string contains null character')
-                    continue
+        return t
 
-                # We get the byte value of the
-                # hexadecimal sequence (if valid)
-                try:
-                    byte_value = int('0x{}'.format(hex_value), 0)
-                except ValueError:
-                    lineno, column = self.find_pos_string(original, '\\{}{}'.format(base, hex_value))
+    #################
+    # Use the lexer #
+    #################
 
-                    self.print_error(t.lineno + lineno, column + 1, 'invalid hexadecimal escaped sequence {}'.format(hex_value))
-                    continue
+    # Table module of the lexer (remark : the name must contain
+    # the package, the module is not found otherwise and the
+    # lexer is built again at each use)
+    lextab = 'lexer.lextab'
 
-                # We check if we have to replace
-                # the escaped sequence
-                if byte_value in range(32, 127):
+    # Lexers built (one per lexer class), see 'reset'
+    built_lexers = {}
 
-                    # Exceptions for \" and \\
-                    if hex_value != '22' and hex_value != '5c':
-                        to_replace.append(hex_value)
+    def reset(self):
+        # Build the lexer (only once per lexer class, the next
+        # lexers are copies of the built one, attached to this
+        # object)
+        built = Lexer.built_lexers.get(self.__class__)
 
-            # Not hexadecimal escaped sequence
-            # (necessarily invalid)
-            else:
-                lineno, column = self.find_pos_string(original, '\\{}'.format(base))
+        if built is None:
+            built = lex.lex(module=self, optimize=1, errorlog=lex.NullLogger(), lextab=self.lextab)
+            Lexer.built_lexers[self.__class__] = built
 
-                self.print_error(t.lineno + lineno, column + 1, 'unknow escaped sequence {}'.format(base))
-                continue
+        self.lexer = built.clone(self)
 
-        # We replace hexadecimal sequences
-        # that have to be replaced
-        for hex_value in to_replace:
-            byte_value = int('0x{}'.format(hex_value), 0)
-            char = chr(byte_value)
+        # We start in the initial state (remark : this also attaches
+        # the rules of the initial state to this object)
+        self.lexer.begin('INITIAL')
 
-            t.value = t.value.replace(r'\x{}'.format(hex_value), char)
+    # Number of tokens written at once on the standard output
+    # when the tokens are dumped
+    dump_batch_size = 4096
 
-        return t
+    def dump_tokens(self, tokens, dump_format='text'):
+        """
+        Writes the tokens 'tokens' on the standard output (in the
+        format 'dump_format', 'text' or 'jsonl'), in a single write.
+        """
 
-    #################
-    # Use the lexer #
-    #################
+        line_starts = self.line_index.line_starts
+        names = self.dump_names
+        lines = []
 
-    def reset(self):
-        # Build the lexer
-        self.lexer = lex.lex(module=self, optimize=1, errorlog=lex.NullLogger(), lextab='lextab')
+        for token in tokens:
+            # We get column and type of the token (remark : the
+            # line of the token is known, so its column is found
+            # directly from the start of its line)
+            t_column = (token.lexpos - line_starts[token.lineno - 1]) + 1
+            t_type = names[token.type]
+
+            # We format the token (in the right format)
+            if dump_format == 'jsonl':
+                t_dict = {'line': token.lineno, 'column': t_column, 'type': t_type}
+
+                if token.type in self.type_value:
+                    t_dict['value'] = token.value
 
-    def lex(self, dump=False):
+                lines.append(json.dumps(t_dict))
+            elif token.type in self.type_value:
+                lines.append('{},{},{},{}'.format(token.lineno, t_column, t_type, token.value))
+            else:
+                lines.append('{},{},{}'.format(token.lineno, t_column, t_type))
+
+        lines.append('')
+
+        sys.stdout.write('\n'.join(lines))
+
+    def lex(self, dump=False, dump_format='text'):
         # We reset the lexer
         self.reset()
 
         # We give the data as input to the lexer
         self.lexer.input(self.data)
 
-        # Token classes for which we want to display the value
-        type_value = ('INTEGER_LITERAL', 'TYPE_IDENTIFIER', 'OBJECT_IDENTIFIER', 'STRING_LITERAL')
+        # We empty the token list (in case of a new lexing)
+        self.token_list = []
+
+        # If we have to dump the tokens, we get the names of
+        # the token types (in the right format)
+        if dump:
+            self.dump_names = {t: t.replace('_', '-').lower() for t in self.tokens}
+            dumped = 0
 
         # We tokenize
         while True:
@@ -518,31 +565,44 @@ class Lexer:
                 break
 
             # Else, we save the token
-            elif dump:
+            self.token_list.append(token)
 
-                # We get column and type of the token
-                t_column = self.find_column(token)
-                t_type = token.type.replace('_', '-')
+            # If we have to dump the tokens, they are written
+            # by batches (as they are produced)
+            if dump and len(self.token_list) - dumped == self.dump_batch_size:
+                self.dump_tokens(self.token_list[dumped:], dump_format)
+                dumped = len(self.token_list)
 
-                # We print the token (in the right format)
-                if token.type in type_value:
-                    print('{},{},{},{}'.format(token.lineno, t_column, t_type.lower(), token.value))
-                else:
-                    print('{},{},{}'.format(token.lineno, t_column, t_type.lower()))
+        # We dump the remaining tokens
+        if dump and len(self.token_list) > dumped:
+            self.dump_tokens(self.token_list[dumped:], dump_format)
 
         # If there was error(s), we exit with an error code
         if self.has_error:
             sys.exit(1)
 
+        # The parser will read the token list from the beginning
+        self.token_iter = iter(self.token_list)
+
+    def token(self):
+        """
+        Returns the next token of the token list built
+        by the last lexing (or None if there is no more
+        token). This method allows the parser to use
+        this object as a PLY lexer.
+        """
+
+        return next(self.token_iter, None)
+
 
 class LexerExt(Lexer):
     ###############
     # Constructor #
     ###############
 
-    def __init__(self, filename):
+    def __init__(self, source):
         # We call the constructor of the parent class
-        super().__init__(filename)
+        super().__init__(source)
 
         # We define new operators
         self.newop = {'>': 'GREATER', '>=': 'GREATER_EQUAL', '!=': 'DIFF', '&&': 'AND_ALT', '||': 'OR_ALT'}
@@ -564,6 +624,9 @@ class LexerExt(Lexer):
         self.tokens += self.newtok
         self.tokens += list(self.new.values())
 
+        # We also display the value of the new literals
+        self.type_value += self.newtok
+
     ####################
     # Token definition #
     ####################
@@ -617,55 +680,10 @@ class LexerExt(Lexer):
 
         return t
 
-    def lex(self, dump=False):
-        # We reset the lexer
-        self.reset()
-
-        # We give the data as input to the lexer
-        self.lexer.input(self.data)
-
-        # Token classes for which we want to display the value
-        type_value = ('INTEGER_LITERAL', 'DOUBLE_LITERAL', 'TYPE_IDENTIFIER', 'OBJECT_IDENTIFIER', 'STRING_LITERAL')
-
-        # We tokenize
-        while True:
-            # We get the token
-            token = self.lexer.token()
-
-            # If there is no more token
-            if not token:
-
-                # If a multiple-line comment is not terminated,
-                # we print an error
-                if self.is_m_comment():
-                    (lineno, column) = self.m_comments.pop()
-                    self.print_error(lineno, column, 'multi-line comment not closed')
-
-                break
-
-            # Else, we save the token
-            elif dump:
-
-                # We get column and type of the token
-                t_column = self.find_column(token)
-                t_type = token.type.replace('_', '-')
-
-                # We print the token (in the right format)
-                if token.type in type_value:
-                    print('{},{},{},{}'.format(token.lineno, t_column, t_type.lower(), token.value))
-                else:
-                    print('{},{},{}'.format(token.lineno, t_column, t_type.lower()))
-
-        # If there was error(s), we exit with an error code
-        if self.has_error:
-            sys.exit(1)
-
     #################
     # Use the lexer #
     #################
 
-    # Overriden methods
+    # Overriden element
 
-    def reset(self):
-        # Build the lexer
-        self.lexer = lex.lex(module=self, optimize=1, errorlog=lex.NullLogger(), lextab='lextabext')
+    lextab = 'lexer.lextabext'
@@ -0,0 +1,143 @@
+"""
+INFO0085-1 - Compilers
+University of Liege
+Academic year 2019-2020
+
+Authors :
+    - Maxime Meurisse
+    - Valentin Vermeylen
+"""
+
+###########
+# Imports #
+###########
+
+import os
+import sys
+import mmap
+import bisect
+
+
+###########
+# Classes #
+###########
+
+class LineIndex:
+    """
+    Index of the beginning of each line of a source text. The
+    text is indexed once and the index is shared by the stages
+    of the compiler (lexer, parser, ...) to convert a position
+    in the text (offset from its beginning) into a line and a
+    column.
+    """
+
+    ###############
+    # Constructor #
+    ###############
+
+    def __init__(self, data):
+        # We save the position of the first character of each
+        # line (the first line begins at position 0)
+        self.line_starts = [0]
+
+        find, append = data.find, self.line_starts.append
+        pos = find('\n')
+
+        while pos != -1:
+            append(pos + 1)
+            pos = find('\n', pos + 1)
+
+    #################
+    # Use the index #
+    #################
+
+    def find_position(self, pos):
+        """
+        Returns the line and the column (from 1) of the
+        position 'pos'.
+        """
+
+        lineno = bisect.bisect_right(self.line_starts, pos)
+
+        return lineno, (pos - self.line_starts[lineno - 1]) + 1
+
+    def find_column(self, pos):
+        """
+        Returns the column (from 1) of the position 'pos'.
+        """
+
+        line_start = self.line_starts[bisect.bisect_right(self.line_starts, pos) - 1]
+
+        return (pos - line_start) + 1
+
+
+class SourceFile:
+    """
+    VSOP source text (read once) shared by all the stages of the
+    compiler (lexer, parser, semantic analysis and code
+    generation), with the index of its lines.
+
+    The text can come from a file ('open'), from the standard
+    input ('read_stdin') or directly from a string (constructor).
+    """
+
+    # Size (in bytes) from which a file is mapped in memory
+    # instead of being read (the text is decoded directly from
+    # the mapping, without an intermediate copy)
+    mmap_threshold = 1 << 24
+
+    ###############
+    # Constructor #
+    ###############
+
+    def __init__(self, name, data, path=None):
+        # We save the name of the source (to print errors) and
+        # the path of the file (None if the source is not a file)
+        self.name = name
+        self.path = path
+
+        # We save the text and we index its lines
+        self.data = data
+        self.line_index = LineIndex(data)
+
+    @classmethod
+    def open(cls, path):
+        """
+        Returns the source text of the file 'path'.
+        """
+
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+
+            if size >= cls.mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    data = str(m, 'ascii')
+            else:
+                data = str(f.read(), 'ascii')
+
+        return cls(path, data, path)
+
+    @classmethod
+    def read_stdin(cls):
+        """
+        Returns the source text read on the standard input.
+        """
+
+        return cls('<stdin>', str(sys.stdin.buffer.read(), 'ascii'))
+
+    ##################
+    # Use the source #
+    ##################
+
+    @property
+    def basename(self):
+        """
+        Path of the outputs of the compilation (executable, ...),
+        without extension. It is the path of the file without
+        its extension ('a.out' if the source is not a file).
+        """
+
+        if self.path is None:
+            return 'a.out'
+
+        return os.path.splitext(self.path)[0]
@@ -13,14 +13,19 @@ Authors :
 ###########
 
 import os
+import sys
 
 import llvm.predefined as predefined
 
 import llvmlite.ir as ir
 import llvmlite.binding as llvm
 
+from types import GeneratorType
 from collections import OrderedDict
 
+from parser.ast import Visitor, Literal
+from semantic.tables import Scope
+
 
 ####################
 # Type definitions #
@@ -39,24 +44,162 @@ t_double = ir.DoubleType()
 t_void = ir.VoidType()
 
 
+##################
+# Target machine #
+##################
+
+# Target machine used to emit native code (created once, the
+# first time it is needed)
+target_machine = None
+
+
+def get_target_machine():
+    """
+    Returns the target machine of the host.
+    """
+
+    global target_machine
+
+    if target_machine is None:
+        llvm.initialize_native_target()
+        llvm.initialize_native_asmprinter()
+
+        target = llvm.Target.from_default_triple()
+        target_machine = target.create_target_machine(reloc='pic')
+
+    return target_machine
+
+
+def parse_module(llvm_ir, context=None):
+    """
+    Parses the LLVM IR code 'llvm_ir' (in the LLVM context
+    'context', the global one by default) and returns the LLVM
+    module, for the target machine of the host.
+    """
+
+    machine = get_target_machine()
+
+    module = llvm.parse_assembly(llvm_ir, context)
+    module.triple = machine.triple
+    module.data_layout = str(machine.target_data)
+
+    return module
+
+
+def link_exec(source, obj):
+    """
+    Links the object code 'obj' (bytes) to create the native
+    executable of the VSOP source 'source'.
+    """
+
+    # Get the base name of the source file
+    basename = source.basename
+
+    # We write the object file
+    o_name = '{}.o'.format(basename)
+
+    with open(o_name, 'wb') as o_file:
+        o_file.write(obj)
+
+    # Link the object file to create an executable
+    command = 'clang {} -o {} -lm'.format(o_name, basename)
+    status = os.system(command)
+
+    os.remove(o_name)
+
+    if status != 0:
+        print('{}: error: can not link the executable'.format(source.name), file=sys.stderr)
+        sys.exit(1)
+
+
+###########
+# Runtime #
+###########
+
+# Bitcode of the LLVM module of the 'Object' class (parsed and
+# verified once, the first time it is needed)
+object_bitcode = None
+
+
+def get_object_module(context):
+    """
+    Returns the LLVM module of the 'Object' class, in the LLVM
+    context 'context'.
+
+    Remark : each compilation has its own LLVM context (otherwise
+    the types of a program would be renamed if a type with the
+    same name was defined by a previous compilation of the same
+    process), so the runtime module is kept as bitcode, which is
+    much faster to load than LLVM IR code.
+    """
+
+    global object_bitcode
+
+    if object_bitcode is None:
+        module = parse_module(predefined.object_llvm)
+        module.verify()
+
+        object_bitcode = module.as_bitcode()
+
+    return llvm.parse_bitcode(object_bitcode, context)
+
+
 ###########
 # Classes #
 ###########
 
-class LLVM:
+class ClassLayout:
+    """
+    Layout of the objects of a class, computed once from its
+    fields and methods (inherited ones first) : the index of each
+    field in the structure of the class and the index (slot) of
+    each method in its VTable.
+    """
+
+    def __init__(self, fields, methods):
+        # Index of each field in the structure (the first element
+        # of the structure is the VTable and the fields of type
+        # 'unit' are not stored)
+        self.fields = {}
+
+        index = 1
+
+        for name, value in fields.items():
+            if value['type'] != 'unit':
+                self.fields[name] = index
+
+                index += 1
+
+        # Slot of each method in the VTable
+        self.methods = {}
+
+        for slot, name in enumerate(methods):
+            self.methods[name] = slot
+
+
+class LLVM(Visitor):
     ###############
     # Constructor #
     ###############
 
-    def __init__(self, filename, a_ast):
-        # We save the VSOP source file name
-        self.filename = filename
+    def __init__(self, source, a_ast):
+        # We build the dispatch table of the nodes
+        super().__init__()
+
+        # We save the VSOP source and its name
+        self.source = source
+        self.filename = source.name
 
         # We save the annotated AST to generate LLVM IR code
         self.a_ast = a_ast
 
-        # We create the LLVM IR module (a single module per VSOP source file)
-        self.module = ir.Module(name=__file__)
+        # Dictionary that associates each class to its node
+        self.classes = {c.name: c for c in a_ast.classes}
+
+        # We create the LLVM IR module (a single module per VSOP source file).
+        # The module has its own context, so that the types of the classes
+        # do not conflict with the ones of a previous compilation.
+        self.module = ir.Module(name=__file__, context=ir.Context())
 
         # Current IR builder
         self.builder = None
@@ -74,6 +217,7 @@ class LLVM:
         #                                           [ret]       : str
         #                                           [obj_type]  : obj
         #                                           [obj]       : obj
+        #                [layout]        : obj
         #                [parent]        : str
         self.st = {}
 
@@ -86,6 +230,14 @@ class LLVM:
         # Current class name during analyzing phase
         self.current_class = None
 
+        # Function computing the power of 'int32' values (see
+        # 'get_power_function')
+        self.power_function = None
+
+        # Function computing the quotient of 'int32' values (see
+        # 'get_division_function')
+        self.division_function = None
+
     #############
     # Utilities #
     #############
@@ -115,47 +267,6 @@ class LLVM:
         # We return the new dictionary
         return d
 
-    def get_number_fields(self, name):
-        # We iterate over each class
-        for c in self.a_ast.classes:
-
-            # We check the name of the class
-            if c.name == name:
-
-                # We return the number of fields
-                return len(c.fields)
-
-    def get_position(self, d, name, field=True):
-        # We iterate over the element of the dictionary
-        i = 0
-        pos = 0
-
-        for key, value in d.items():
-
-            # We check if we found the element
-            if key == name:
-                return pos
-
-            # We increment the counter
-            i += 1
-
-            if field:
-                if value['type'] != 'unit':
-                    pos += 1
-            else:
-                pos += 1
-
-    def lookup(self, stack, name):
-        # We iterate over each element
-        for d in stack:
-
-            # We check if the value exist
-            if d.get(name) is not None:
-                return d[name]
-
-        # Else we return a 'None'
-        return None
-
     def process_string(self, s):
         # We remove first and last character (because
         # it is '"')
@@ -226,25 +337,198 @@ class LLVM:
 
     def import_functions(self):
         # We create the 'malloc' function
-        module = ir.Module(name='malloc')
-
         malloc_t = ir.FunctionType(t_int8.as_pointer(), (t_int64,))
-        malloc_f = ir.Function(module, malloc_t, name='malloc')
+        malloc_f = ir.Function(self.module, malloc_t, name='malloc')
 
         self.imported_functions['malloc'] = malloc_f
 
-        # We create the 'pow' function
-        pow_t = ir.FunctionType(t_double, (t_double, t_double))
-        pow_f = ir.Function(self.module, pow_t, name='pow')
-
-        self.imported_functions['pow'] = pow_f
-
         # We create the 'strcmp' function
         strcmp_t = ir.FunctionType(t_int32, (t_string, t_string))
         strcmp_f = ir.Function(self.module, strcmp_t, name='strcmp')
 
         self.imported_functions['strcmp'] = strcmp_f
 
+    def get_power_function(self):
+        """
+        Returns the function computing the power of two 'int32'
+        values (created in the module the first time it is needed).
+
+        The power is computed by square-and-multiply (the products
+        wrap around as the other operations on 'int32' values). A
+        negative exponent gives 1 / (base ^ -exponent), truncated
+        toward zero as a division : 1 for a base 1, 1 or -1 for a
+        base -1 (depending on the parity of the exponent) and 0
+        otherwise.
+        """
+
+        if self.power_function is not None:
+            return self.power_function
+
+        # We create the function (internal to the module)
+        power_t = ir.FunctionType(t_int32, (t_int32, t_int32))
+        power_f = ir.Function(self.module, power_t, name='power_int32')
+        power_f.linkage = 'internal'
+
+        base, exponent = power_f.args
+
+        entry_bb = power_f.append_basic_block('entry')
+        negative_bb = power_f.append_basic_block('negative')
+        loop_bb = power_f.append_basic_block('loop')
+        body_bb = power_f.append_basic_block('body')
+        end_bb = power_f.append_basic_block('end')
+
+        builder = ir.IRBuilder(entry_bb)
+
+        is_negative = builder.icmp_signed('<', exponent, t_int32(0))
+        builder.cbranch(is_negative, negative_bb, loop_bb)
+
+        # Negative exponent
+        builder.position_at_end(negative_bb)
+
+        is_odd = builder.trunc(exponent, t_bool)
+        minus_one_power = builder.select(is_odd, t_int32(-1), t_int32(1))
+
+        is_minus_one = builder.icmp_signed('==', base, t_int32(-1))
+        value = builder.select(is_minus_one, minus_one_power, t_int32(0))
+
+        is_one = builder.icmp_signed('==', base, t_int32(1))
+        builder.ret(builder.select(is_one, t_int32(1), value))
+
+        # Square-and-multiply loop (the bits of the exponent are
+        # used from the lowest one)
+        builder.position_at_end(loop_bb)
+
+        result = builder.phi(t_int32, 'result')
+        square = builder.phi(t_int32, 'square')
+        bits = builder.phi(t_int32, 'bits')
+
+        is_done = builder.icmp_signed('==', bits, t_int32(0))
+        builder.cbranch(is_done, end_bb, body_bb)
+
+        builder.position_at_end(body_bb)
+
+        is_odd = builder.trunc(bits, t_bool)
+        product = builder.mul(result, square)
+        next_result = builder.select(is_odd, product, result)
+        next_square = builder.mul(square, square)
+        next_bits = builder.lshr(bits, t_int32(1))
+        builder.branch(loop_bb)
+
+        result.add_incoming(t_int32(1), entry_bb)
+        result.add_incoming(next_result, body_bb)
+        square.add_incoming(base, entry_bb)
+        square.add_incoming(next_square, body_bb)
+        bits.add_incoming(exponent, entry_bb)
+        bits.add_incoming(next_bits, body_bb)
+
+        builder.position_at_end(end_bb)
+        builder.ret(result)
+
+        self.power_function = power_f
+
+        return power_f
+
+    def power(self, lhs, rhs, exponent_expr):
+        """
+        Returns the value of 'lhs ^ rhs' ('int32' values), the
+        exponent being the value of the expression 'exponent_expr'.
+        If the exponent is a non negative literal, the products of
+        the square-and-multiply are generated directly.
+        """
+
+        if isinstance(exponent_expr, Literal) and exponent_expr.type == 'integer' and 0 <= exponent_expr.literal < 2 ** 31:
+            exponent = exponent_expr.literal
+
+            result = None
+            square = lhs
+
+            while exponent != 0:
+                if exponent & 1:
+                    result = square if result is None else self.builder.mul(result, square, 'powtmp')
+
+                exponent >>= 1
+
+                if exponent != 0:
+                    square = self.builder.mul(square, square, 'powtmp')
+
+            return result if result is not None else t_int32(1)
+
+        return self.builder.call(self.get_power_function(), (lhs, rhs))
+
+    def get_division_function(self):
+        """
+        Returns the function computing the quotient of two 'int32'
+        values (created in the module the first time it is needed).
+
+        The result does not depend on the optimization level : a
+        division by zero stops the program with an error (see
+        'division_by_zero' in the 'Object' module) and the overflow
+        of 'INT32_MIN / -1' wraps around, giving 'INT32_MIN'.
+        """
+
+        if self.division_function is not None:
+            return self.division_function
+
+        # We declare the function reporting a division by zero
+        # (defined in the 'Object' module)
+        error_t = ir.FunctionType(ir.VoidType(), ())
+        error_f = ir.Function(self.module, error_t, name='division_by_zero')
+        error_f.attributes.add('noreturn')
+        error_f.attributes.add('cold')
+
+        # We create the function (internal to the module)
+        division_t = ir.FunctionType(t_int32, (t_int32, t_int32))
+        division_f = ir.Function(self.module, division_t, name='divide_int32')
+        division_f.linkage = 'internal'
+
+        dividend, divisor = division_f.args
+
+        entry_bb = division_f.append_basic_block('entry')
+        zero_bb = division_f.append_basic_block('zero')
+        nonzero_bb = division_f.append_basic_block('nonzero')
+        minus_one_bb = division_f.append_basic_block('minus_one')
+        divide_bb = division_f.append_basic_block('divide')
+
+        builder = ir.IRBuilder(entry_bb)
+
+        is_zero = builder.icmp_signed('==', divisor, t_int32(0))
+        builder.cbranch(is_zero, zero_bb, nonzero_bb)
+
+        # Division by zero
+        builder.position_at_end(zero_bb)
+        builder.call(error_f, ())
+        builder.unreachable()
+
+        # Division by -1 (the negation wraps around for INT32_MIN)
+        builder.position_at_end(nonzero_bb)
+
+        is_minus_one = builder.icmp_signed('==', divisor, t_int32(-1))
+        builder.cbranch(is_minus_one, minus_one_bb, divide_bb)
+
+        builder.position_at_end(minus_one_bb)
+        builder.ret(builder.neg(dividend))
+
+        # Other divisors
+        builder.position_at_end(divide_bb)
+        builder.ret(builder.sdiv(dividend, divisor))
+
+        self.division_function = division_f
+
+        return division_f
+
+    def divide(self, lhs, rhs, divisor_expr):
+        """
+        Returns the value of 'lhs / rhs' ('int32' values), the
+        divisor being the value of the expression 'divisor_expr'.
+        If the divisor is a literal other than 0 and -1, the
+        division is generated directly.
+        """
+
+        if isinstance(divisor_expr, Literal) and divisor_expr.type == 'integer' and divisor_expr.literal not in (0, -1):
+            return self.builder.sdiv(lhs, rhs, 'divtmp')
+
+        return self.builder.call(self.get_division_function(), (lhs, rhs), 'divtmp')
+
     def initialize_st(self):
         # We add the 'Object' class to the symbol table
         self.initialize_object()
@@ -286,8 +570,8 @@ class LLVM:
 
             # We create the dictionary for the class
             d_class = {
-                'struct': ir.global_context.get_identified_type('struct.{}'.format(c.name)),
-                'struct_vtable': ir.global_context.get_identified_type('struct.{}VTable'.format(c.name)),
+                'struct': self.module.context.get_identified_type('struct.{}'.format(c.name)),
+                'struct_vtable': self.module.context.get_identified_type('struct.{}VTable'.format(c.name)),
                 'global_vtable': None,
                 'new': None,
                 'init': None,
@@ -354,6 +638,10 @@ class LLVM:
             self.st[c.name]['fields'] = self.concatenate_dict(d_fields, self.st[c.name]['fields'])
             self.st[c.name]['methods'] = self.concatenate_dict(d_methods, self.st[c.name]['methods'])
 
+            # We compute the layout of the class (index of each
+            # field and of each method)
+            self.st[c.name]['layout'] = ClassLayout(self.st[c.name]['fields'], self.st[c.name]['methods'])
+
         # We iterate over each class
         for c in self.a_ast.classes:
 
@@ -408,15 +696,14 @@ class LLVM:
             self.st[c.name]['init'] = init
 
     def initialize_object(self):
-        # Opaque context reference to group modules into logical groups
-        context = ir.Context()
-
-        # New module for 'Object'
-        module = ir.Module(name='Object')
+        # The 'Object' class is defined in the runtime module (linked
+        # with the module of the program), so we only declare its
+        # elements in the module of the program
+        module = self.module
 
         # The two structures defined in object.ll
-        struct = context.get_identified_type('struct.Object')
-        struct_vtable = context.get_identified_type('struct.ObjectVTable')
+        struct = module.context.get_identified_type('struct.Object')
+        struct_vtable = module.context.get_identified_type('struct.ObjectVTable')
 
         # Create the body of the Object structure (contains a pointer to the VTable)
         struct.set_body(*[struct_vtable.as_pointer()])
@@ -475,6 +762,7 @@ class LLVM:
             'init': init,
             'fields': OrderedDict(),
             'methods': d_methods,
+            'layout': ClassLayout({}, d_methods),
             'parent': None
         }
 
@@ -518,29 +806,24 @@ class LLVM:
         gep = self.builder.gep(init.args[0], [t_int32(0), t_int32(0)], inbounds=True)
         self.builder.store(self.st[name]['global_vtable'], gep)
 
-        # Initialize fields' value
-        number_fields = len(self.st[name]['fields'])
-
-        pos = number_fields - self.get_number_fields(name)
-
-        for i in range(number_fields - self.get_number_fields(name), number_fields):
-            f = list(self.st[name]['fields'].values())[i]
+        # Initialize fields' value (only the fields defined in the
+        # class, the inherited ones are initialized by the parent)
+        for field in self.classes[name].fields:
+            f = self.st[name]['fields'][field.name]
 
             if f['type'] == 'unit':
                 if f['init_expr'] is not None:
-                    self.codegen(f['init_expr'], [])
+                    self.codegen(f['init_expr'], Scope())
 
                 continue
-            else:
-                pos += 1
 
             if f['init_expr'] is not None:
-                init_val = self.codegen(f['init_expr'], [])
+                init_val = self.codegen(f['init_expr'], Scope())
             else:
                 init_val = self.default_init(f['type'])
 
             bitcast = self.builder.bitcast(init_val, self.get_type(f['type']))
-            gep = self.builder.gep(init.args[0], [t_int32(0), t_int32(pos)])
+            gep = self.builder.gep(init.args[0], [t_int32(0), t_int32(self.st[name]['layout'].fields[field.name])])
             self.builder.store(bitcast, gep)
 
         self.builder.branch(endif_bb)
@@ -656,7 +939,7 @@ class LLVM:
                             d_args[name] = 'unit'
 
                 # We analyze the body of the method
-                value = self.codegen(m.block, [d_args])
+                value = self.codegen(m.block, Scope(d_args))
 
                 # We return the value
                 if value == t_void:
@@ -668,21 +951,62 @@ class LLVM:
     # Code generation #
     ###################
 
-    def codegen(self, node, stack):
-        # We get the method name corresponding to the node
-        method = 'codegen_' + node.__class__.__name__
+    # Prefix of the methods generating the code of the nodes
+    # (see 'Visitor' class)
+    prefix = 'codegen_'
 
-        # We return the value of the expression
-        return getattr(self, method)(node, stack)
+    def codegen(self, node, stack):
+        """
+        Generates the code of the expression 'node' (in the scope
+        'stack') and returns its value.
+
+        As for the semantic analysis, the methods generating the
+        code of an expression with sub-expressions are generators :
+        they yield each sub-expression (with its scope) and receive
+        its value. The sub-expressions are thus generated with an
+        explicit stack of generators instead of recursive calls
+        (the instructions are emitted in the same order).
+        """
+
+        # Stack of the expressions being generated (with the
+        # generator of each of them)
+        pending = []
+
+        # We get the value of the expression (the method
+        # corresponding to the node is given by the dispatch table)
+        result = self.dispatch_table[node.__class__](node, stack)
+
+        while True:
+            # If the expression has sub-expressions, we start
+            # its generation
+            if isinstance(result, GeneratorType):
+                pending.append(result)
+                value = None
+
+            # Else, we give the value to the expression waiting
+            # for it (if any)
+            elif not pending:
+                return result
+            else:
+                value = result
+
+            # We resume the generation of the last pending expression
+            try:
+                node, stack = pending[-1].send(value)
+            except StopIteration as e:
+                pending.pop()
+                result = e.value
+            else:
+                result = self.dispatch_table[node.__class__](node, stack)
 
     def codegen_If(self, node, stack):
         # We get the condition value
-        cond_val = self.codegen(node.cond_expr, stack)
+        cond_val = yield node.cond_expr, stack
 
         # If there is no 'else' branch
         if node.else_expr is None:
             with self.builder.if_then(cond_val) as then:
-                v = self.codegen(node.then_expr, stack)
+                v = yield node.then_expr, stack
 
             return t_unit
 
@@ -690,9 +1014,9 @@ class LLVM:
         elif node.expr_type == 'unit':
             with self.builder.if_else(cond_val) as (then, otherwise):
                 with then:
-                    v_then = self.codegen(node.then_expr, stack)
+                    v_then = yield node.then_expr, stack
                 with otherwise:
-                    v_otherwise = self.codegen(node.else_expr, stack)
+                    v_otherwise = yield node.else_expr, stack
 
             return t_unit
 
@@ -706,7 +1030,7 @@ class LLVM:
             # We check branches
             with self.builder.if_else(cond_val) as (then, otherwise):
                 with then:
-                    v_then = self.codegen(node.then_expr, stack)
+                    v_then = yield node.then_expr, stack
 
                     # We cast the value
                     v_cast = self.builder.bitcast(v_then, type_if)
@@ -714,7 +1038,7 @@ class LLVM:
                     # We store the value
                     self.builder.store(v_cast, ptr_if)
                 with otherwise:
-                    v_otherwise = self.codegen(node.else_expr, stack)
+                    v_otherwise = yield node.else_expr, stack
 
                     # We cast the value
                     v_cast = self.builder.bitcast(v_otherwise, type_if)
@@ -735,12 +1059,12 @@ class LLVM:
 
         # We build the condition
         self.builder.position_at_end(cond_bb)
-        cond_val = self.codegen(node.cond_expr, stack)
+        cond_val = yield node.cond_expr, stack
         self.builder.cbranch(cond_val, loop_bb, end_bb)
 
         # We build the loop
         self.builder.position_at_end(loop_bb)
-        loop_val = self.codegen(node.body_expr, stack)
+        loop_val = yield node.body_expr, stack
         self.builder.branch(cond_bb)
 
         # We return after the loop
@@ -760,7 +1084,7 @@ class LLVM:
         if node.init_expr is not None:
 
             # We get the value of the initialize
-            value = self.codegen(node.init_expr, stack)
+            value = yield node.init_expr, stack
 
             # We cast and store the value
             cast = self.builder.bitcast(value, assignee_type)
@@ -773,21 +1097,25 @@ class LLVM:
             value = self.default_init(assignee_type)
             self.builder.store(value, arg_ptr)
 
-        # Create a new symbol table (dictionary) for the 'let'
-        d_let = {node.name: arg_ptr}
+        # We add the element to the scope of the block
+        stack.push(node.name, arg_ptr)
 
         # Return the value of the block
-        return self.codegen(node.scope_expr, [d_let] + stack)
+        value = yield node.scope_expr, stack
+
+        stack.pop()
+
+        return value
 
     def codegen_Assign(self, node, stack):
         # We get the type of the assignee
         assignee_type = self.st[node.expr_type]['struct']
 
         # We get the value assigned
-        value = self.codegen(node.expr, stack)
+        value = yield node.expr, stack
 
         # We get the pointer to the assignee
-        assignee_ptr = self.lookup(stack, node.name)
+        assignee_ptr = stack.lookup(node.name)
 
         # If the pointer exists, it means that the assignee
         # is an argument of a function
@@ -808,14 +1136,13 @@ class LLVM:
                 return t_unit
 
             # We get the pointer to the element itself
-            ptr_self = self.builder.load(self.lookup(stack, 'self'))
+            ptr_self = self.builder.load(stack.lookup('self'))
 
             # We get field information
             d_field = self.st[self.current_class]['fields'][node.name]
 
             # We get the field offset
-            field_offset = self.get_position(self.st[self.current_class]['fields'], node.name)
-            field_offset += 1
+            field_offset = self.st[self.current_class]['layout'].fields[node.name]
 
             # We get the pointer to the field
             ptr_field = self.builder.gep(ptr_self, [t_int32(0), t_int32(field_offset)], inbounds=True)
@@ -831,27 +1158,11 @@ class LLVM:
 
     def codegen_UnOp(self, node, stack):
         # We get the value of the expression
-        expr_value = self.codegen(node.expr, stack)
+        expr_value = yield node.expr, stack
 
         # We call the corresponding method
         if node.op == 'not':
-
-            # We allocate memory for return type
-            ptr_op = self.builder.alloca(t_bool)
-
-            # We check branches
-            with self.builder.if_else(expr_value) as (then, otherwise):
-
-                # If 'expr_value' is true
-                with then:
-                    self.builder.store(t_bool(0), ptr_op)
-
-                # If 'expr_value' is false
-                with otherwise:
-                    self.builder.store(t_bool(1), ptr_op)
-
-            # We return the value of the comparison
-            return self.builder.load(ptr_op)
+            return self.builder.xor(expr_value, t_bool(1), 'nottmp')
         elif node.op == '-':
             return self.builder.sub(t_int32(0), expr_value, 'subtmp')
         elif node.op == 'isnull':
@@ -861,38 +1172,11 @@ class LLVM:
         # We check if we are in a 'and' case. We need to know because
         # in this case, we do not evaluate directly both operands
         if node.op == 'and':
-
-            # We allocate memory for return type
-            ptr_op = self.builder.alloca(t_bool)
-
-            # We evaluate left operand
-            lhs = self.codegen(node.left_expr, stack)
-
-            # We check branches
-            with self.builder.if_else(lhs) as (then, otherwise):
-
-                # If 'lhs' is true
-                with then:
-
-                    # We evaluate right operand
-                    rhs = self.codegen(node.right_expr, stack)
-
-                    # We cast the value
-                    v_cast = self.builder.bitcast(rhs, t_bool)
-
-                    # We store the value
-                    self.builder.store(v_cast, ptr_op)
-
-                # If 'lhs' is false
-                with otherwise:
-                    self.builder.store(t_bool(0), ptr_op)
-
-            # We return the value of the comparison
-            return self.builder.load(ptr_op)
+            return (yield from self.short_circuit(node, stack, True))
         else:
             # We get left and right operands
-            lhs = self.codegen(node.left_expr, stack)
-            rhs = self.codegen(node.right_expr, stack)
+            lhs = yield node.left_expr, stack
+            rhs = yield node.right_expr, stack
 
             # We check according to the operator
             if node.op == '=':
@@ -924,22 +1208,53 @@ class LLVM:
             elif node.op == '*':
                 return self.builder.mul(lhs, rhs, 'multmp')
             elif node.op == '/':
-                return self.builder.sdiv(lhs, rhs, 'divtmp')
+                return self.divide(lhs, rhs, node.right_expr)
             elif node.op == '^':
-                # We cast the operands to 'double' (in order to call the
-                # 'pow' function)
-                lhs_double = self.builder.uitofp(lhs, t_double)
-                rhs_double = self.builder.uitofp(rhs, t_double)
+                return self.power(lhs, rhs, node.right_expr)
 
-                # Call the 'pow' function
-                call = self.builder.call(self.imported_functions['pow'], (lhs_double, rhs_double))
+    def short_circuit(self, node, stack, is_and):
+        """
+        Generates the code of the logical operation 'node' ('and'
+        if 'is_and' is True, 'or' otherwise) : the right operand is
+        only evaluated if the left one does not give the result.
+        The value is a 'phi' of the two paths (no memory is used).
+        """
 
-                # Return the result (converted to int)
-                return self.builder.fptoui(call, t_int32)
+        # We evaluate left operand
+        lhs = yield node.left_expr, stack
+        lhs_bb = self.builder.block
+
+        # We create basic blocks
+        rhs_bb = self.builder.append_basic_block('rhs')
+        end_bb = self.builder.append_basic_block('endlogic')
+
+        # If the left operand gives the result, we skip the right one
+        if is_and:
+            self.builder.cbranch(lhs, rhs_bb, end_bb)
+        else:
+            self.builder.cbranch(lhs, end_bb, rhs_bb)
+
+        # We evaluate right operand (its code may end in another
+        # basic block)
+        self.builder.position_at_end(rhs_bb)
+
+        rhs = yield node.right_expr, stack
+        rhs_bb = self.builder.block
+
+        self.builder.branch(end_bb)
+
+        # We return the value of the operation
+        self.builder.position_at_end(end_bb)
+
+        phi = self.builder.phi(t_bool, 'logictmp')
+        phi.add_incoming(t_bool(0 if is_and else 1), lhs_bb)
+        phi.add_incoming(rhs, rhs_bb)
+
+        return phi
 
     def codegen_Call(self, node, stack):
         # We get the pointer to the caller
-        ptr_caller = self.codegen(node.obj_expr, stack)
+        ptr_caller = yield node.obj_expr, stack
 
         # We get the type (class name) of the caller
         ptr_type = node.obj_expr.expr_type
@@ -952,7 +1267,7 @@ class LLVM:
         d_method = d_class['methods'][node.method_name]
 
         # We get the position of the method in the VTable
-        method_offset = self.get_position(self.st[ptr_type]['methods'], node.method_name, False)
+        method_offset = self.st[ptr_type]['layout'].methods[node.method_name]
 
         # We get the VTable
         gep_vtable = self.builder.gep(ptr_caller, [t_int32(0), t_int32(0)], inbounds=True)
@@ -979,7 +1294,7 @@ class LLVM:
                 continue
 
             # We get the value of the argument
-            arg_value = self.codegen(arg, stack)
+            arg_value = yield arg, stack
 
             # We cast the argument
             arg_value = self.builder.bitcast(arg_value, d_method['obj_type'].args[i + 1])
@@ -1005,11 +1320,11 @@ class LLVM:
         # in the 'Call' node. So we have to return a pointer
         # to the element itself (element which call the
         # method)
-        return self.builder.load(self.lookup(stack, 'self'))
+        return self.builder.load(stack.lookup('self'))
 
     def codegen_ObjectIdentifier(self, node, stack):
         # We get the element
-        e = self.lookup(stack, node.id)
+        e = stack.lookup(node.id)
 
         # If the element exists, it means that it is an
         # argument of the function
@@ -1031,13 +1346,11 @@ class LLVM:
                 return t_unit
 
             # We get the pointer to the element itself
-            ptr_self = self.builder.load(self.lookup(stack, 'self'))
+            ptr_self = self.builder.load(stack.lookup('self'))
 
             # We get the position of the field in the object structure
-            offset = self.get_position(self.st[self.current_class]['fields'], node.id)
-
-            # Because the first element of the structure is the VTable
-            offset += 1
+            # (the first element of the structure is the VTable)
+            offset = self.st[self.current_class]['layout'].fields[node.id]
 
             # We get the pointer to the field
             ptr_field = self.builder.gep(ptr_self, [t_int32(0), t_int32(offset)], inbounds=True)
@@ -1077,7 +1390,7 @@ class LLVM:
     def codegen_Block(self, node, stack):
         # We iterate over each expression
         for e in node.expr_list:
-            value = self.codegen(e, stack)
+            value = yield e, stack
 
         # We return the value of the block (i.e. the value
         # of the last expression of the block)
@@ -1099,32 +1412,57 @@ class LLVM:
         # We get the LLVM IR code
         llvm_ir = str(self.module)
 
-        # We remove the first two lines
-        llvm_ir = llvm_ir.split('\n', 2)[2]
+        # We return the LLVM IR code (remark : the 'Object' class
+        # is only declared, its code is linked in 'generate_module')
+        return llvm_ir
+
+    def generate_module(self, llvm_ir, opt_level=0):
+        # We get the target machine of the host
+        machine = get_target_machine()
 
-        # We append the LLVM IR code of the 'Object' class
-        llvm_ir = predefined.object_llvm + llvm_ir
+        # We parse the LLVM IR code (in a new LLVM context)
+        context = llvm.create_context()
+        module = parse_module(llvm_ir, context)
 
-        # We return the complete LLVM IR code
-        return llvm_ir
+        # We link the 'Object' class and we verify the complete
+        # module
+        module.link_in(get_object_module(context))
+        module.verify()
+
+        # We optimize the module, if asked (the pass pipeline of
+        # the optimization level contains, among others, 'mem2reg',
+        # 'instcombine', 'GVN', inlining and loop passes)
+        if opt_level > 0:
+            options = llvm.create_pipeline_tuning_options(speed_level=opt_level)
+            pass_builder = llvm.create_pass_builder(machine, options)
+
+            pass_builder.getModulePassManager().run(module, pass_builder)
 
-    def generate_exec(self, llvm_ir):
+        # We return the LLVM module
+        return module
+
+    def generate_object(self, module, save_temps=False):
         # Get the base name of the source file
-        basename = os.path.splitext(self.filename)[0]
+        basename = self.source.basename
+
+        # We get the target machine of the host
+        machine = get_target_machine()
 
-        # Export the LLVM IR code in a '.ll' file
-        ll_name = '{}.ll'.format(basename)
+        # If asked, we export the LLVM IR code in a '.ll' file
+        # and the assembly code in a '.s' file
+        if save_temps:
+            with open('{}.ll'.format(basename), 'w') as ll_file:
+                ll_file.write(str(module))
 
-        with open(ll_name, 'w') as ll_file:
-            ll_file.write(llvm_ir)
+            with open('{}.s'.format(basename), 'w') as s_file:
+                s_file.write(machine.emit_assembly(module))
 
-        # Transform the LLVM code to assembly
-        command = 'llc-9 {}'.format(ll_name)
-        os.system(command)
+        # We return the object code of the module
+        return machine.emit_object(module)
 
-        # Compile assembly file to create an executable
-        command = 'clang {}.s -o {} -lm'.format(basename, basename)
-        os.system(command)
+    def generate_exec(self, obj):
+        # Link the object code to create an executable
+        link_exec(self.source, obj)
 
 
 class LLVMExt(LLVM):
@@ -1132,9 +1470,9 @@ class LLVMExt(LLVM):
     # Constructor #
     ###############
 
-    def __init__(self, filename, a_ast):
+    def __init__(self, source, a_ast):
         # We call the constructor of the parent class
-        super().__init__(filename, a_ast)
+        super().__init__(source, a_ast)
 
     ###################
     # Code generation #
@@ -1142,6 +1480,16 @@ class LLVMExt(LLVM):
 
     # Overriden methods
 
+    def import_functions(self):
+        # We import the functions of the parent class
+        super().import_functions()
+
+        # We create the 'pow' function (power of 'double' values)
+        pow_t = ir.FunctionType(t_double, (t_double, t_double))
+        pow_f = ir.Function(self.module, pow_t, name='pow')
+
+        self.imported_functions['pow'] = pow_f
+
     def initialize_primitives(self):
         # We add primitives types to the symbol table
         self.st['int32'] = {'struct': t_int32}
@@ -1152,14 +1500,11 @@ class LLVMExt(LLVM):
 
     def codegen_UnOp(self, node, stack):
         # We get the value of the expression
-        expr_value = self.codegen(node.expr, stack)
+        expr_value = yield node.expr, stack
 
         # We call the corresponding method
         if node.op == 'not':
-            if expr_value == t_bool(1):
-                return t_bool(0)
-            else:
-                return t_bool(1)
+            return self.builder.xor(expr_value, t_bool(1), 'nottmp')
         elif node.op == '-':
             if node.expr.expr_type == 'double':
                 return self.builder.sub(t_double(0.0), expr_value, 'subtmp')
@@ -1173,60 +1518,11 @@ class LLVMExt(LLVM):
         # know because in this case, we do not evaluate directly
         # both operands
         if node.op in ['and', 'or', '&&', '||']:
-
-            # We allocate memory for return type
-            ptr_op = self.builder.alloca(t_bool)
-
-            # We evaluate left operand
-            lhs = self.codegen(node.left_expr, stack)
-
-            # We check branches
-            with self.builder.if_else(lhs) as (then, otherwise):
-
-                # If 'lhs' is true
-                with then:
-
-                    # If operator is 'or'
-                    if node.op in ['or', '||']:
-                        self.builder.store(t_bool(1), ptr_op)
-
-                    # If operator is 'and'
-                    if node.op in ['and', '&&']:
-
-                        # We evaluate right operand
-                        rhs = self.codegen(node.right_expr, stack)
-
-                        # We cast the value
-                        v_cast = self.builder.bitcast(rhs, t_bool)
-
-                        # We store the value
-                        self.builder.store(v_cast, ptr_op)
-
-                # If 'lhs' is false
-                with otherwise:
-
-                    # If operator is 'and'
-                    if node.op in ['and', '&&']:
-                        self.builder.store(t_bool(0), ptr_op)
-
-                    # If operator is 'or'
-                    if node.op in ['or', '||']:
-
-                        # We evaluate right operand
-                        rhs = self.codegen(node.right_expr, stack)
-
-                        # We cast the value
-                        v_cast = self.builder.bitcast(rhs, t_bool)
-
-                        # We store the value
-                        self.builder.store(v_cast, ptr_op)
-
-            # We return the value of the comparison
-            return self.builder.load(ptr_op)
+            return (yield from self.short_circuit(node, stack, node.op in ['and', '&&']))
         else:
             # We get left and right operands
-            lhs = self.codegen(node.left_expr, stack)
-            rhs = self.codegen(node.right_expr, stack)
+            lhs = yield node.left_expr, stack
+            rhs = yield node.right_expr, stack
 
             # We get the comparison function
             if node.left_expr.expr_type == 'double':
@@ -1285,18 +1581,14 @@ class LLVMExt(LLVM):
                 if node.left_expr.expr_type == 'double':
                     return self.builder.fdiv(lhs, rhs, 'divtmp')
                 else:
-                    return self.builder.sdiv(lhs, rhs, 'divtmp')
+                    return self.divide(lhs, rhs, node.right_expr)
             elif node.op == '^':
-                # We cast the operands to 'double' (in order to call the
-                # 'pow' function)
-                lhs_double = self.builder.uitofp(lhs, t_double)
-                rhs_double = self.builder.uitofp(rhs, t_double)
-
-                # Call the 'pow' function
-                call = self.builder.call(self.imported_functions['pow'], (lhs_double, rhs_double))
-
-                # Return the result (converted to int)
-                return self.builder.fptoui(call, t_int32)
+                # The power of 'double' values is computed by the
+                # 'pow' function of the C library
+                if node.left_expr.expr_type == 'double':
+                    return self.builder.call(self.imported_functions['pow'], (lhs, rhs))
+                else:
+                    return self.power(lhs, rhs, node.right_expr)
 
     def codegen_Literal(self, node, stack):
         # If literal is a 'int32'
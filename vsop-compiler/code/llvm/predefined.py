@@ -56,6 +56,7 @@ declare i32 @ungetc(i32, %struct._IO_FILE*)
 @.str.7 = constant [39 x i8] c"Object::inputInt32: cannot read word!\0A\00"
 @.str.8 = constant [58 x i8] c"Object::inputInt32: `%s` is not a valid integer literal!\0A\00"
 @.str.9 = constant [57 x i8] c"Object::inputInt32: `%s` does not fit a 32-bit integer!\0A\00"
+@.str.10 = constant [26 x i8] c"error: division by zero!\0A\00"
 
 ; Object's shared vtable instance
 
@@ -283,6 +284,15 @@ define %struct.Object* @Object_init(%struct.Object*) {
   ret %struct.Object* %0
 }
 
+; Runtime errors
+
+define void @division_by_zero() {
+  %1 = load %struct._IO_FILE*, %struct._IO_FILE** @stderr
+  %2 = call i32 (%struct._IO_FILE*, i8*, ...) @fprintf(%struct._IO_FILE* %1, i8* getelementptr inbounds ([26 x i8], [26 x i8]* @.str.10, i64 0, i64 0))
+  call void @exit(i32 1)
+  unreachable
+}
+
 ; Utility functions
 
 define internal i8* @read_until(i32 (i32)*) {
@@ -18,20 +18,19 @@ import os
 import sys
 import argparse
 
-from lexer.lexer import Lexer, LexerExt
-from parser.parser import Parser, ParserExt
-from semantic.semantic import Semantic, SemanticExt
-from llvm.llvm import LLVM, LLVMExt
+# Remark : the modules of the compiler (lexer, parser, ...) are
+# imported in 'compile_source' only, so that a client of the
+# compiler server does not have to load them (nor 'llvmlite')
 
 
-########
-# Main #
-########
+#############
+# Functions #
+#############
 
-if __name__ == '__main__':
-    #########################
-    # Initialize arg parser #
-    #########################
+def get_arg_parser():
+    """
+    Returns the parser of the executable arguments.
+    """
 
     # We instantiate the parser (for executable arguments)
     arg_parser = argparse.ArgumentParser(description='VSOPC is a compiler for the object-oriented language VSOP. By default, VSOPC generate a native executable.')
@@ -45,90 +44,237 @@ if __name__ == '__main__':
     group.add_argument('-check', help='dump annotated AST on stdout and stop', action='store_true')
     group.add_argument('-llvm', help='dump LLVM IR on stdout and stop', action='store_true')
 
-    arg_parser.add_argument('source', help='path to the VSOP source file', type=str)
+    arg_parser.add_argument('--format', help='format of the tokens or of the AST dumped by -lex, -parse and -check (default : text)', type=str, choices=['text', 'jsonl'], default='text')
 
-    # We parse arguments
-    args = arg_parser.parse_args()
+    arg_parser.add_argument('-O', help='optimization level of the generated code (from 0 to 3, default : 0)', dest='opt_level', metavar='LEVEL', type=int, choices=range(4), default=0)
+    arg_parser.add_argument('--save-temps', help='keep the LLVM IR (.ll) and assembly (.s) files of the executable', action='store_true')
+    arg_parser.add_argument('--no-cache', help='do not use the compilation cache (~/.cache/vsopc)', action='store_true')
 
-    #######################
-    # Argument management #
-    #######################
+    server_group = arg_parser.add_mutually_exclusive_group()
+    server_group.add_argument('--serve', help='start a compiler server listening on the Unix socket SOCKET', metavar='SOCKET', type=str)
+    server_group.add_argument('--connect', help='send the compilation to the compiler server listening on SOCKET', metavar='SOCKET', type=str)
+
+    arg_parser.add_argument('--batch', help='compile all the VSOP source files of the directory DIR (and its subdirectories)', metavar='DIR', type=str, action='append', default=[])
+    arg_parser.add_argument('-j', '--jobs', help='number of worker processes of a batch compilation (default : number of processors)', metavar='N', type=int)
+
+    arg_parser.add_argument('source', help='path to the VSOP source file(s) ("-" for the standard input)', type=str, nargs='*')
+
+    return arg_parser
+
+
+def compile_sources(args):
+    """
+    Compiles the VSOP source file(s) given in the executable
+    arguments 'args' (already parsed). Several files are
+    compiled as a batch.
+    """
 
-    if args.source:
-        # We get the VSOP source file path
-        source = args.source
+    from batch.batch import Batch, find_sources
 
+    # We get the VSOP source files
+    sources = list(args.source)
+
+    for directory in args.batch:
+        if not os.path.isdir(directory):
+            print('main.py: error: "{}" is not a directory'.format(directory), file=sys.stderr)
+            sys.exit(1)
+
+        sources += find_sources(directory)
+
+    # If there is a single file, it is compiled directly
+    if len(sources) == 1 and not args.batch:
+        args.source = sources[0]
+        compile_source(args)
+    else:
+        sys.exit(Batch(compile_source, args.jobs).compile(args, sources))
+
+
+def compile_source(args):
+    """
+    Compiles the VSOP source file given in the executable
+    arguments 'args' (already parsed).
+    """
+
+    from lexer.source import SourceFile
+    from lexer.lexer import Lexer, LexerExt
+    from parser.parser import Parser, ParserExt
+    from parser.ast import Printer
+    from semantic.semantic import Semantic, SemanticExt
+    from optimizer.optimizer import Optimizer, OptimizerExt
+    from llvm.llvm import LLVM, LLVMExt, get_target_machine, parse_module, link_exec
+    from cache.cache import Cache
+
+    # We get the VSOP source file path ('-' for the standard
+    # input)
+    path = args.source
+
+    if path == '-':
+        source = SourceFile.read_stdin()
+    else:
         # We check the extension of the file
         valid_ext = ['.vsop', '.vsopext']
-        source_ext = os.path.splitext(source)[1]
+        source_ext = os.path.splitext(path)[1]
 
         if source_ext not in valid_ext:
             print('main.py: error: extension of the input file must be "{}" or "{}"'.format(valid_ext[0], valid_ext[1]), file=sys.stderr)
             sys.exit(1)
 
         # We check if the VSOP file exist
-        if not os.path.isfile(source):
-            print('main.py: error: "{}" does not exist'.format(source), file=sys.stderr)
+        if not os.path.isfile(path):
+            print('main.py: error: "{}" does not exist'.format(path), file=sys.stderr)
             sys.exit(1)
 
-        # We tokenize the source file (remark : we do not save
-        # the token list because lexing is done implicitly in
-        # the parser after)
-        if args.ext:
-            vsop_lexer = LexerExt(source)
-        else:
-            vsop_lexer = Lexer(source)
-
-        # If there is the '-lex' arg
-        if args.lex:
-            vsop_lexer.lex(dump=True)
-            sys.exit(0)
-        else:
-            vsop_lexer.lex()
+        # We read the file (only once, the source is shared by
+        # all the stages of the compiler)
+        source = SourceFile.open(path)
 
-        # If we get there, we parse the VSOP file (remark : lexing
-        # is done implicitly in the parsing so we reset the lexer
-        # in order to not have conflict with previous information
-        # of the last lexing)
-        vsop_lexer.reset()
+    # If the compilation goes up to the LLVM IR code (or further),
+    # we look for it in the cache (remark : only successful
+    # compilations are cached, they do not print anything on
+    # stderr)
+    cache = None
 
-        if args.ext:
-            vsop_parser = ParserExt(source, vsop_lexer)
-        else:
-            vsop_parser = Parser(source, vsop_lexer)
+    if not (args.lex or args.parse or args.check or args.save_temps or args.no_cache):
+        cache = Cache(source, args.ext, args.opt_level)
+        cached_ir = cache.load('.ll')
 
-        ast = vsop_parser.parse()
+        if cached_ir is not None:
+            llvm_ir = cached_ir.decode('utf8')
 
-        # If there is the '-parse' arg
-        if args.parse:
-            print(ast)
-            sys.exit(0)
+            # If there is the '-llvm' arg
+            if args.llvm:
+                print(llvm_ir)
+                sys.exit(0)
 
-        # If we get there, we annotate the AST
-        if args.ext:
-            vsop_semantic = SemanticExt(source, ast)
-        else:
-            vsop_semantic = Semantic(source, ast)
+            # If we get there (no arg), we link the cached object
+            # code (generated from the cached LLVM IR code if it is
+            # not in the cache yet)
+            obj = cache.load('.o')
 
-        a_ast = vsop_semantic.annotate()
+            if obj is None:
+                obj = get_target_machine().emit_object(parse_module(llvm_ir))
+                cache.store('.o', obj)
 
-        # If there is the '-check' arg
-        if args.check:
-            print(a_ast)
+            link_exec(source, obj)
             sys.exit(0)
 
-        # If we get there, we generate the LLVM IR code
-        if args.ext:
-            vsop_llvm = LLVMExt(source, a_ast)
-        else:
-            vsop_llvm = LLVM(source, a_ast)
+    # We tokenize the source file (remark : the lexer keeps
+    # the token list, which is read by the parser after)
+    if args.ext:
+        vsop_lexer = LexerExt(source)
+    else:
+        vsop_lexer = Lexer(source)
 
-        llvm_ir = vsop_llvm.generate_ir()
+    # If there is the '-lex' arg
+    if args.lex:
+        vsop_lexer.lex(dump=True, dump_format=args.format)
+        sys.exit(0)
+    else:
+        vsop_lexer.lex()
 
-        # If there is the '-llvm' arg
-        if args.llvm:
-            print(llvm_ir)
-            sys.exit(0)
+    # If we get there, we parse the VSOP file (remark : the
+    # parser reads the tokens produced by the lexing above,
+    # so the file is tokenized only once)
+    if args.ext:
+        vsop_parser = ParserExt(source, vsop_lexer)
+    else:
+        vsop_parser = Parser(source, vsop_lexer)
+
+    ast = vsop_parser.parse()
+
+    # If there is the '-parse' arg
+    if args.parse:
+        Printer(sys.stdout).write(ast, args.format)
+        print()
+        sys.exit(0)
+
+    # If we get there, we annotate the AST
+    if args.ext:
+        vsop_semantic = SemanticExt(source, ast)
+    else:
+        vsop_semantic = Semantic(source, ast)
+
+    a_ast = vsop_semantic.annotate()
+
+    # If there is the '-check' arg
+    if args.check:
+        Printer(sys.stdout).write(a_ast, args.format)
+        print()
+        sys.exit(0)
+
+    # If we get there, we optimize the annotated AST (constant
+    # folding, algebraic simplifications, ...)
+    if args.ext:
+        vsop_optimizer = OptimizerExt(source, a_ast)
+    else:
+        vsop_optimizer = Optimizer(source, a_ast)
+
+    o_ast = vsop_optimizer.optimize()
+
+    # We generate the LLVM IR code
+    if args.ext:
+        vsop_llvm = LLVMExt(source, o_ast)
+    else:
+        vsop_llvm = LLVM(source, o_ast)
+
+    llvm_ir = vsop_llvm.generate_ir()
+
+    # We link the LLVM IR code with the 'Object' class (and we
+    # optimize it, if asked)
+    llvm_module = vsop_llvm.generate_module(llvm_ir, args.opt_level)
+
+    if cache is not None:
+        cache.store('.ll', str(llvm_module).encode('utf8'))
+
+    # If there is the '-llvm' arg
+    if args.llvm:
+        print(llvm_module)
+        sys.exit(0)
+
+    # If we get there (no arg), we generate a native executable
+    obj = vsop_llvm.generate_object(llvm_module, args.save_temps)
+
+    if cache is not None:
+        cache.store('.o', obj)
+
+    vsop_llvm.generate_exec(obj)
+
+
+########
+# Main #
+########
+
+if __name__ == '__main__':
+    #########################
+    # Initialize arg parser #
+    #########################
+
+    arg_parser = get_arg_parser()
+
+    # We parse arguments
+    args = arg_parser.parse_args()
+
+    #######################
+    # Argument management #
+    #######################
+
+    # If there is the '--serve' arg, we start the compiler
+    # server (until it is interrupted)
+    if args.serve:
+        from server.server import Server
+
+        Server(args.serve, get_arg_parser, compile_sources).serve()
+        sys.exit(0)
+
+    # Else, a VSOP source file (or a directory) is needed
+    if not (args.source or args.batch):
+        arg_parser.error('the following arguments are required: source (or --batch)')
+
+    # If there is the '--connect' arg, the compilation is
+    # done by the compiler server
+    if args.connect:
+        from server.server import Client
+
+        sys.exit(Client(args.connect).compile(sys.argv[1:]))
 
-        # If we get there (no arg), we generate a native executable
-        vsop_llvm.generate_exec(llvm_ir)
+    compile_sources(args)
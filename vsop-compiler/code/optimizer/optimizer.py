@@ -0,0 +1,566 @@
+"""
+INFO0085-1 - Compilers
+University of Liege
+Academic year 2019-2020
+
+Authors :
+    - Maxime Meurisse
+    - Valentin Vermeylen
+"""
+
+###########
+# Imports #
+###########
+
+from types import GeneratorType
+
+from parser.ast import *
+
+
+#############
+# Constants #
+#############
+
+# Bounds of the 'int32' type
+INT32_MIN = -2 ** 31
+INT32_MAX = 2 ** 31 - 1
+
+
+#############
+# Functions #
+#############
+
+def wrap_int32(value):
+    """
+    Returns the integer 'value' wrapped to the 'int32' type (as
+    the arithmetic operations of the generated code).
+    """
+
+    return (value - INT32_MIN) % 2 ** 32 + INT32_MIN
+
+
+def decode_string(literal):
+    """
+    Returns the characters of the string literal 'literal' (as
+    in the generated code, the string ends at its first null
+    character).
+    """
+
+    s = literal[1:-1]
+
+    # We change all the escaped sequences
+    charbuf = []
+    i = 0
+
+    while i < len(s):
+        if s[i] == '\\':
+            charbuf.append(chr(int(s[i + 2:i + 4], 16)))
+
+            i += 4
+        else:
+            charbuf.append(s[i])
+
+            i += 1
+
+    return ''.join(charbuf).split('\0', 1)[0]
+
+
+###########
+# Classes #
+###########
+
+class Optimizer(Visitor):
+    """
+    Optimization pass over the annotated AST, between the semantic
+    analysis and the code generation : the constant expressions are
+    folded, some algebraic identities are simplified (e.g. 'x * 1',
+    'x + 0', 'true and x') and the branches of an 'if' (or the body
+    of a 'while') that can not be executed are removed.
+
+    The semantics of VSOP are kept : the operations on 'int32' wrap
+    around, a division by zero (or of the smallest 'int32' by -1) is
+    left to the generated code and an expression is only removed if
+    it has no side effect.
+    """
+
+    ###############
+    # Constructor #
+    ###############
+
+    def __init__(self, source, a_ast):
+        # We build the dispatch table of the expressions
+        super().__init__()
+
+        # We save the VSOP source and its name
+        self.source = source
+        self.filename = source.name
+
+        # We save the annotated AST to optimize it
+        self.a_ast = a_ast
+
+    #############
+    # Utilities #
+    #############
+
+    def literal(self, expr, value, _type):
+        """
+        Returns a literal (of VSOP type '_type') with the value
+        'value', replacing the expression 'expr'.
+        """
+
+        if _type == 'bool':
+            literal = Literal(expr.lineno, expr.column, 'true' if value else 'false', 'boolean')
+        elif _type == 'int32':
+            literal = Literal(expr.lineno, expr.column, value, 'integer')
+        else:
+            literal = Literal(expr.lineno, expr.column, value, _type)
+
+        literal.expr_type = _type
+
+        return literal
+
+    def get_constant(self, expr):
+        """
+        Returns the value of the expression 'expr' if it is a
+        literal (an 'int32' in the range of the type, a 'bool' as
+        a Python boolean), None otherwise.
+        """
+
+        if not isinstance(expr, Literal):
+            return None
+
+        if expr.type == 'integer':
+            if INT32_MIN <= expr.literal <= INT32_MAX:
+                return expr.literal
+
+            return None
+        elif expr.type == 'boolean':
+            return expr.literal == 'true'
+        else:
+            return expr.literal
+
+    def replace(self, expr, by):
+        """
+        Returns the expression replacing 'expr' by the expression
+        'by' (None if the replacement would change the type of
+        the expression).
+        """
+
+        if by.expr_type == expr.expr_type:
+            return by
+
+        # The value of an expression of type 'unit' is not used,
+        # so we only keep the evaluation of 'by'
+        if expr.expr_type == 'unit':
+            unit = Unit(expr.lineno, expr.column)
+            unit.expr_type = 'unit'
+
+            block = Block(expr.lineno, expr.column)
+            block.expr_list = [by, unit]
+            block.expr_type = 'unit'
+
+            return block
+
+        return None
+
+    def is_pure(self, expr):
+        """
+        Returns True if the evaluation of the expression 'expr'
+        has no side effect.
+        """
+
+        return isinstance(expr, (Literal, Unit, Self, ObjectIdentifier))
+
+    ######################
+    # Integer operations #
+    ######################
+
+    def fold_int32(self, op, lhs, rhs):
+        """
+        Returns the value of the operation 'op' on the 'int32'
+        values 'lhs' and 'rhs' (None if it is not folded).
+        """
+
+        if op == '+':
+            return wrap_int32(lhs + rhs)
+        elif op == '-':
+            return wrap_int32(lhs - rhs)
+        elif op == '*':
+            return wrap_int32(lhs * rhs)
+        elif op == '/':
+            # A division by zero (or an overflow) is left to the
+            # generated code
+            if rhs == 0 or (lhs == INT32_MIN and rhs == -1):
+                return None
+
+            # The division truncates toward zero
+            quotient = abs(lhs) // abs(rhs)
+
+            return quotient if (lhs < 0) == (rhs < 0) else -quotient
+        elif op == '^':
+            return self.fold_power(lhs, rhs)
+        elif op == '<':
+            return lhs < rhs
+        elif op == '<=':
+            return lhs <= rhs
+        elif op == '>':
+            return lhs > rhs
+        elif op == '>=':
+            return lhs >= rhs
+
+        return None
+
+    def fold_power(self, lhs, rhs):
+        """
+        Returns the value of 'lhs ^ rhs' (as computed by the
+        generated code, see 'LLVM.get_power_function').
+        """
+
+        # A negative exponent gives the inverse of the power,
+        # truncated toward zero
+        if rhs < 0:
+            if lhs == 1:
+                return 1
+            elif lhs == -1:
+                return -1 if rhs % 2 else 1
+            else:
+                return 0
+
+        return wrap_int32(pow(lhs, rhs, 2 ** 32))
+
+    ##########################
+    # Expressions management #
+    ##########################
+
+    # Prefix of the methods optimizing the expressions (see
+    # 'Visitor' class)
+    prefix = 'fold_'
+
+    def optimize_expr(self, expr):
+        """
+        Optimizes the expression 'expr' and returns the expression
+        replacing it.
+
+        As for the semantic analysis, the methods optimizing an
+        expression with sub-expressions are generators : they yield
+        each sub-expression and receive the expression replacing it
+        (the sub-expressions are optimized first). The expressions
+        without sub-expressions are kept as they are.
+        """
+
+        # Stack of the expressions being optimized (generators)
+        pending = []
+
+        while True:
+            # We optimize the expression depending of his type (class)
+            fold = self.dispatch_table.get(expr.__class__)
+
+            if fold is None:
+                result = expr
+            else:
+                result = fold(expr)
+
+            # If the expression has sub-expressions, we start
+            # its optimization
+            if isinstance(result, GeneratorType):
+                pending.append(result)
+                result = None
+
+            # Else, we give the result to the expression waiting
+            # for it (if any)
+            elif not pending:
+                return result
+
+            # We resume the optimization of the last pending expression
+            while True:
+                try:
+                    expr = pending[-1].send(result)
+
+                    break
+                except StopIteration as e:
+                    pending.pop()
+                    result = e.value
+
+                    if not pending:
+                        return result
+
+    def fold_Block(self, expr):
+        # We optimize each expression of the block
+        expr_list = []
+        last = len(expr.expr_list) - 1
+
+        for i, e in enumerate(expr.expr_list):
+            e = yield e
+
+            # We remove the expressions whose value is not used
+            # and without side effect
+            if i == last or not self.is_pure(e):
+                expr_list.append(e)
+
+        expr.expr_list = expr_list
+
+        return expr
+
+    def fold_If(self, expr):
+        expr.cond_expr = yield expr.cond_expr
+        expr.then_expr = yield expr.then_expr
+
+        if expr.else_expr is not None:
+            expr.else_expr = yield expr.else_expr
+
+        cond = self.get_constant(expr.cond_expr)
+
+        # If the condition is constant, only one branch is kept
+        if cond is not None:
+            if cond:
+                branch = expr.then_expr
+            elif expr.else_expr is not None:
+                branch = expr.else_expr
+            else:
+                branch = Unit(expr.lineno, expr.column)
+                branch.expr_type = 'unit'
+
+            replacement = self.replace(expr, branch)
+
+            if replacement is not None:
+                return replacement
+
+        return expr
+
+    def fold_While(self, expr):
+        expr.cond_expr = yield expr.cond_expr
+        expr.body_expr = yield expr.body_expr
+
+        # If the condition is false, the loop is removed
+        if self.get_constant(expr.cond_expr) is False:
+            unit = Unit(expr.lineno, expr.column)
+            unit.expr_type = 'unit'
+
+            return unit
+
+        return expr
+
+    def fold_Let(self, expr):
+        if expr.init_expr is not None:
+            expr.init_expr = yield expr.init_expr
+
+        expr.scope_expr = yield expr.scope_expr
+
+        return expr
+
+    def fold_Assign(self, expr):
+        expr.expr = yield expr.expr
+
+        return expr
+
+    def fold_UnOp(self, expr):
+        expr.expr = yield expr.expr
+
+        value = self.get_constant(expr.expr)
+
+        if expr.op == 'not':
+            # 'not not x' is 'x'
+            if isinstance(expr.expr, UnOp) and expr.expr.op == 'not':
+                return expr.expr.expr
+
+            if value is not None:
+                return self.literal(expr, not value, 'bool')
+        elif expr.op == '-':
+            if expr.expr_type == 'int32' and value is not None:
+                return self.literal(expr, wrap_int32(-value), 'int32')
+
+        return expr
+
+    def fold_BinOp(self, expr):
+        expr.left_expr = yield expr.left_expr
+        expr.right_expr = yield expr.right_expr
+
+        op = expr.op
+        left, right = expr.left_expr, expr.right_expr
+
+        lhs = self.get_constant(left)
+        rhs = self.get_constant(right)
+
+        # Logical operators (the right operand is only evaluated
+        # if needed)
+        if op in ['and', '&&']:
+            if lhs is not None:
+                return right if lhs else self.literal(expr, False, 'bool')
+            if rhs is True:
+                return left
+
+            return expr
+        elif op in ['or', '||']:
+            if lhs is not None:
+                return self.literal(expr, True, 'bool') if lhs else right
+            if rhs is False:
+                return left
+
+            return expr
+
+        operand_type = left.expr_type
+
+        # Constant operands
+        if lhs is not None and rhs is not None:
+            value = None
+
+            if op in ['=', '!=']:
+                if operand_type == 'string':
+                    value = decode_string(lhs) == decode_string(rhs)
+                elif operand_type in ['int32', 'bool']:
+                    value = lhs == rhs
+
+                if value is not None and op == '!=':
+                    value = not value
+            elif operand_type == 'int32':
+                value = self.fold_int32(op, lhs, rhs)
+
+            if value is not None:
+                return self.literal(expr, value, expr.expr_type)
+
+        # Both operands of type 'unit'
+        if op in ['=', '!='] and isinstance(left, Unit) and isinstance(right, Unit):
+            return self.literal(expr, op == '=', 'bool')
+
+        # Algebraic identities
+        if operand_type == 'int32':
+            if op == '+':
+                if lhs == 0:
+                    return right
+                if rhs == 0:
+                    return left
+            elif op == '-':
+                if rhs == 0:
+                    return left
+            elif op == '*':
+                if lhs == 1:
+                    return right
+                if rhs == 1:
+                    return left
+            elif op == '/':
+                if rhs == 1:
+                    return left
+
+        return expr
+
+    def fold_Call(self, expr):
+        expr.obj_expr = yield expr.obj_expr
+
+        for i, e in enumerate(expr.expr_list):
+            expr.expr_list[i] = yield e
+
+        return expr
+
+    ################
+    # Optimization #
+    ################
+
+    def optimize(self):
+        # We iterate over each class
+        for c in self.a_ast.classes:
+
+            # We optimize the initializers of the fields
+            for f in c.fields:
+                if f.init_expr is not None:
+                    f.init_expr = self.optimize_expr(f.init_expr)
+
+            # We optimize the body of the methods
+            for m in c.methods:
+                m.block = self.optimize_expr(m.block)
+
+        # We return the optimized AST
+        return self.a_ast
+
+
+class OptimizerExt(Optimizer):
+    #############
+    # Utilities #
+    #############
+
+    # Overriden methods
+
+    def literal(self, expr, value, _type):
+        if _type == 'double':
+            literal = Literal(expr.lineno, expr.column, value, 'double')
+            literal.expr_type = 'double'
+
+            return literal
+
+        return super().literal(expr, value, _type)
+
+    ##########################
+    # Expressions management #
+    ##########################
+
+    # Overriden methods
+
+    def fold_UnOp(self, expr):
+        # In extended VSOP, '-' also applies to 'double' values
+        if expr.op == '-' and expr.expr_type == 'double':
+            expr.expr = yield expr.expr
+
+            value = self.get_constant(expr.expr)
+
+            if value is not None:
+                return self.literal(expr, -value, 'double')
+
+            return expr
+
+        return (yield from super().fold_UnOp(expr))
+
+    def fold_BinOp(self, expr):
+        # In extended VSOP, the arithmetic and comparison operators
+        # also apply to 'double' values
+        if expr.left_expr.expr_type == 'double':
+            expr.left_expr = yield expr.left_expr
+            expr.right_expr = yield expr.right_expr
+
+            lhs = self.get_constant(expr.left_expr)
+            rhs = self.get_constant(expr.right_expr)
+
+            if lhs is not None and rhs is not None:
+                value = self.fold_double(expr.op, lhs, rhs)
+
+                if value is not None:
+                    return self.literal(expr, value, expr.expr_type)
+
+            return expr
+
+        return (yield from super().fold_BinOp(expr))
+
+    #####################
+    # Double operations #
+    #####################
+
+    def fold_double(self, op, lhs, rhs):
+        """
+        Returns the value of the operation 'op' on the 'double'
+        values 'lhs' and 'rhs' (None if it is not folded).
+        """
+
+        if op == '+':
+            return lhs + rhs
+        elif op == '-':
+            return lhs - rhs
+        elif op == '*':
+            return lhs * rhs
+        elif op == '/':
+            # A division by zero is left to the generated code
+            if rhs == 0.0:
+                return None
+
+            return lhs / rhs
+        elif op == '=':
+            return lhs == rhs
+        elif op == '!=':
+            return lhs != rhs
+        elif op == '<':
+            return lhs < rhs
+        elif op == '<=':
+            return lhs <= rhs
+        elif op == '>':
+            return lhs > rhs
+        elif op == '>=':
+            return lhs >= rhs
+
+        return None
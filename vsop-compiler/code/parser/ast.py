@@ -8,6 +8,13 @@ Authors :
     - Valentin Vermeylen
 """
 
+###########
+# Imports #
+###########
+
+import io
+import json
+
 
 ###########
 # Classes #
@@ -15,63 +22,93 @@ Authors :
 
 class Node:
     """
-    Parent class of all AST elements. Since Python does not
-    support abstract classes natively, this class is not
-    really useful.
+    Parent class of all AST elements.
 
-    For the sake of code clarity, we decided to keep it.
+    All the elements use '__slots__' (no dictionary per
+    instance) and the position of an element (line and column)
+    is packed in a single integer, since an AST can contain
+    hundreds of thousands of elements.
     """
 
-    pass
+    __slots__ = ('position',)
+
+    def __init__(self, lineno=0, column=0):
+        self.position = (lineno << 32) | column
+
+    @property
+    def lineno(self):
+        return self.position >> 32
+
+    @property
+    def column(self):
+        return self.position & 0xFFFFFFFF
+
+    def parts(self):
+        """
+        Returns the parts of the textual representation of the
+        element, in order (strings and child elements, the child
+        elements are printed in their turn, see 'Printer').
+        """
+
+        return []
+
+    def __str__(self):
+        output = io.StringIO()
+        Printer(output).write(self)
+
+        return output.getvalue()
 
 
 class Program(Node):
+    __slots__ = ('classes',)
+
     def __init__(self):
         self.classes = []
 
-    def __str__(self):
-        output = '['
+    def parts(self):
+        output = ['[']
 
         for i, c in enumerate(self.classes):
-            if i == 0:
-                output += str(c)
-            else:
-                output += ', \n' + str(c)
+            if i != 0:
+                output.append(', \n')
+
+            output.append(c)
 
-        return output + ']'
+        output.append(']')
+
+        return output
 
     def add_class(self, c):
-        self.classes = [c] + self.classes
+        self.classes.append(c)
 
 
 class Class(Node):
+    __slots__ = ('name', 'parent', 'fields', 'methods')
+
     def __init__(self, lineno, column, name, parent='Object'):
-        self.lineno = lineno
-        self.column = column
+        super().__init__(lineno, column)
 
         self.name = name
         self.parent = parent
         self.fields = []
         self.methods = []
 
-    def __str__(self):
-        output = 'Class(' + self.name + ', ' + self.parent + ', ['
+    def parts(self):
+        output = ['Class(' + self.name + ', ' + self.parent + ', [']
 
         for i, f in enumerate(self.fields):
-            if i == 0:
-                output += '\n\t' + str(f)
-            else:
-                output += ', \n\t' + str(f)
+            output.append('\n\t' if i == 0 else ', \n\t')
+            output.append(f)
 
-        output += '], ['
+        output.append('], [')
 
         for i, m in enumerate(self.methods):
-            if i == 0:
-                output += '\n\t' + str(m)
-            else:
-                output += ', \n\t' + str(m)
+            output.append('\n\t' if i == 0 else ', \n\t')
+            output.append(m)
 
-        return output + '])'
+        output.append('])')
+
+        return output
 
     def add_field(self, f):
         self.fields.append(f)
@@ -81,58 +118,65 @@ class Class(Node):
 
 
 class Field(Node):
+    __slots__ = ('name', 'type', 'init_expr')
+
     def __init__(self, lineno, column, name, _type, init_expr):
-        self.lineno = lineno
-        self.column = column
+        super().__init__(lineno, column)
 
         self.name = name
         self.type = _type
         self.init_expr = init_expr
 
-    def __str__(self):
-        output = 'Field(' + self.name + ', ' + self.type
+    def parts(self):
+        output = ['Field(' + self.name + ', ' + self.type]
 
         if self.init_expr is not None:
-            output += ', ' + str(self.init_expr)
+            output += [', ', self.init_expr]
+
+        output.append(')')
 
-        return output + ')'
+        return output
 
 
 class Method(Node):
+    __slots__ = ('name', 'formals', 'ret_type', 'block')
+
     def __init__(self, lineno, column, name, ret_type, block):
-        self.lineno = lineno
-        self.column = column
+        super().__init__(lineno, column)
 
         self.name = name
         self.formals = []
         self.ret_type = ret_type
         self.block = block
 
-    def __str__(self):
-        output = 'Method(' + self.name + ', ['
+    def parts(self):
+        output = ['Method(' + self.name + ', [']
 
         for i, f in enumerate(self.formals):
-            if i == 0:
-                output += str(f)
-            else:
-                output += ', ' + str(f)
+            if i != 0:
+                output.append(', ')
 
-        return output + '], ' + self.ret_type + ', ' + str(self.block) + ')'
+            output.append(f)
+
+        output += ['], ' + self.ret_type + ', ', self.block, ')']
+
+        return output
 
     def add_formal(self, f):
         self.formals.append(f)
 
 
 class Formal(Node):
+    __slots__ = ('name', 'type')
+
     def __init__(self, lineno, column, name, _type):
-        self.lineno = lineno
-        self.column = column
+        super().__init__(lineno, column)
 
         self.name = name
         self.type = _type
 
-    def __str__(self):
-        return self.name + ' : ' + self.type
+    def parts(self):
+        return [self.name + ' : ' + self.type]
 
 
 class Expr(Node):
@@ -140,283 +184,426 @@ class Expr(Node):
     Parent class of all expression elements.
     """
 
-    def __init__(self):
+    __slots__ = ('expr_type',)
+
+    def __init__(self, lineno, column):
+        super().__init__(lineno, column)
+
         self.expr_type = None
 
+    def typed(self, output):
+        # We add the type of the expression (if the
+        # expression is annotated)
+        if self.expr_type is not None:
+            output.append(' : ' + self.expr_type)
+
+        return output
+
 
 class If(Expr):
-    def __init__(self, lineno, column, cond_expr, then_expr, else_expr):
-        super().__init__()
+    __slots__ = ('cond_expr', 'then_expr', 'else_expr')
 
-        self.lineno = lineno
-        self.column = column
+    def __init__(self, lineno, column, cond_expr, then_expr, else_expr):
+        super().__init__(lineno, column)
 
         self.cond_expr = cond_expr
         self.then_expr = then_expr
         self.else_expr = else_expr
 
-    def __str__(self):
-        output = 'If(' + str(self.cond_expr) + ', ' + str(self.then_expr)
+    def parts(self):
+        output = ['If(', self.cond_expr, ', ', self.then_expr]
 
         if self.else_expr is not None:
-            output += ', ' + str(self.else_expr)
-
-        output += ')'
+            output += [', ', self.else_expr]
 
-        if self.expr_type is not None:
-            output += ' : ' + self.expr_type
+        output.append(')')
 
-        return output
+        return self.typed(output)
 
 
 class While(Expr):
-    def __init__(self, lineno, column, cond_expr, body_expr):
-        super().__init__()
+    __slots__ = ('cond_expr', 'body_expr')
 
-        self.lineno = lineno
-        self.column = column
+    def __init__(self, lineno, column, cond_expr, body_expr):
+        super().__init__(lineno, column)
 
         self.cond_expr = cond_expr
         self.body_expr = body_expr
 
-    def __str__(self):
-        output = 'While(' + str(self.cond_expr) + ', ' + str(self.body_expr) + ')'
-
-        if self.expr_type is not None:
-            output += ' : ' + self.expr_type
-
-        return output
+    def parts(self):
+        return self.typed(['While(', self.cond_expr, ', ', self.body_expr, ')'])
 
 
 class Let(Expr):
-    def __init__(self, lineno, column, name, _type, init_expr, scope_expr):
-        super().__init__()
+    __slots__ = ('name', 'type', 'init_expr', 'scope_expr')
 
-        self.lineno = lineno
-        self.column = column
+    def __init__(self, lineno, column, name, _type, init_expr, scope_expr):
+        super().__init__(lineno, column)
 
         self.name = name
         self.type = _type
         self.init_expr = init_expr
         self.scope_expr = scope_expr
 
-    def __str__(self):
-        output = 'Let(' + self.name + ', ' + self.type
+    def parts(self):
+        output = ['Let(' + self.name + ', ' + self.type]
 
         if self.init_expr is not None:
-            output += ', ' + str(self.init_expr)
+            output += [', ', self.init_expr]
 
-        output += ', ' + str(self.scope_expr) + ')'
+        output += [', ', self.scope_expr, ')']
 
-        if self.expr_type is not None:
-            output += ' : ' + self.expr_type
-
-        return output
+        return self.typed(output)
 
 
 class Assign(Expr):
-    def __init__(self, lineno, column, name, expr):
-        super().__init__()
+    __slots__ = ('name', 'expr')
 
-        self.lineno = lineno
-        self.column = column
+    def __init__(self, lineno, column, name, expr):
+        super().__init__(lineno, column)
 
         self.name = name
         self.expr = expr
 
-    def __str__(self):
-        output = 'Assign(' + self.name + ', ' + str(self.expr) + ')'
-
-        if self.expr_type is not None:
-            output += ' : ' + self.expr_type
-
-        return output
+    def parts(self):
+        return self.typed(['Assign(' + self.name + ', ', self.expr, ')'])
 
 
 class UnOp(Expr):
-    def __init__(self, lineno, column, op, expr):
-        super().__init__()
+    __slots__ = ('op', 'expr')
 
-        self.lineno = lineno
-        self.column = column
+    def __init__(self, lineno, column, op, expr):
+        super().__init__(lineno, column)
 
         self.op = op
         self.expr = expr
 
-    def __str__(self):
-        output = 'UnOp(' + self.op + ', ' + str(self.expr) + ')'
-
-        if self.expr_type is not None:
-            output += ' : ' + self.expr_type
-
-        return output
+    def parts(self):
+        return self.typed(['UnOp(' + self.op + ', ', self.expr, ')'])
 
 
 class BinOp(Expr):
-    def __init__(self, lineno, column, op, left_expr, right_expr):
-        super().__init__()
+    __slots__ = ('op', 'left_expr', 'right_expr')
 
-        self.lineno = lineno
-        self.column = column
+    def __init__(self, lineno, column, op, left_expr, right_expr):
+        super().__init__(lineno, column)
 
         self.op = op
         self.left_expr = left_expr
         self.right_expr = right_expr
 
-    def __str__(self):
-        output = 'BinOp(' + self.op + ', ' + str(self.left_expr) + ', ' + str(self.right_expr) + ')'
-
-        if self.expr_type is not None:
-            output += ' : ' + self.expr_type
-
-        return output
+    def parts(self):
+        return self.typed(['BinOp(' + self.op + ', ', self.left_expr, ', ', self.right_expr, ')'])
 
 
 class Call(Expr):
-    def __init__(self, lineno, column, obj_expr, method_name):
-        super().__init__()
+    __slots__ = ('obj_expr', 'method_name', 'expr_list')
 
-        self.lineno = lineno
-        self.column = column
+    def __init__(self, lineno, column, obj_expr, method_name):
+        super().__init__(lineno, column)
 
         self.obj_expr = obj_expr
         self.method_name = method_name
         self.expr_list = []
 
-    def __str__(self):
-        output = 'Call(' + str(self.obj_expr) + ', ' + self.method_name + ', ['
+    def parts(self):
+        output = ['Call(', self.obj_expr, ', ' + self.method_name + ', [']
 
         for i, e in enumerate(self.expr_list):
-            if i == 0:
-                output += str(e)
-            else:
-                output += ', ' + str(e)
+            if i != 0:
+                output.append(', ')
 
-        output += '])'
+            output.append(e)
 
-        if self.expr_type is not None:
-            output += ' : ' + self.expr_type
+        output.append('])')
 
-        return output
+        return self.typed(output)
 
     def add_expr(self, e):
         self.expr_list.append(e)
 
 
 class New(Expr):
-    def __init__(self, lineno, column, type_name):
-        super().__init__()
+    __slots__ = ('type_name',)
 
-        self.lineno = lineno
-        self.column = column
+    def __init__(self, lineno, column, type_name):
+        super().__init__(lineno, column)
 
         self.type_name = type_name
 
-    def __str__(self):
-        output = 'New(' + self.type_name + ')'
-
-        if self.expr_type is not None:
-            output += ' : ' + self.expr_type
-
-        return output
+    def parts(self):
+        return self.typed(['New(' + self.type_name + ')'])
 
 
 class Self(Expr):
-    def __init__(self, lineno, column):
-        super().__init__()
+    __slots__ = ()
 
-        self.lineno = lineno
-        self.column = column
-
-    def __str__(self):
-        output = 'self'
-
-        if self.expr_type is not None:
-            output += ' : ' + self.expr_type
+    def __init__(self, lineno, column):
+        super().__init__(lineno, column)
 
-        return output
+    def parts(self):
+        return self.typed(['self'])
 
 
 class ObjectIdentifier(Expr):
-    def __init__(self, lineno, column, obj_id):
-        super().__init__()
+    __slots__ = ('id',)
 
-        self.lineno = lineno
-        self.column = column
+    def __init__(self, lineno, column, obj_id):
+        super().__init__(lineno, column)
 
         self.id = obj_id
 
-    def __str__(self):
-        output = self.id
-
-        if self.expr_type is not None:
-            output += ' : ' + self.expr_type
-
-        return output
+    def parts(self):
+        return self.typed([self.id])
 
 
 class Literal(Expr):
-    def __init__(self, lineno, column, literal, _type):
-        super().__init__()
+    __slots__ = ('literal', 'type')
 
-        self.lineno = lineno
-        self.column = column
+    def __init__(self, lineno, column, literal, _type):
+        super().__init__(lineno, column)
 
         self.literal = literal
         self.type = _type
 
-    def __str__(self):
-        output = str(self.literal)
-
-        if self.expr_type is not None:
-            output += ' : ' + self.expr_type
-
-        return output
+    def parts(self):
+        return self.typed([str(self.literal)])
 
 
 class Unit(Expr):
-    def __init__(self, lineno, column):
-        super().__init__()
-
-        self.lineno = lineno
-        self.column = column
+    __slots__ = ()
 
-    def __str__(self):
-        output = '()'
-
-        if self.expr_type is not None:
-            output += ' : ' + self.expr_type
+    def __init__(self, lineno, column):
+        super().__init__(lineno, column)
 
-        return output
+    def parts(self):
+        return self.typed(['()'])
 
 
 class Block(Expr):
-    def __init__(self, lineno, column):
-        super().__init__()
+    __slots__ = ('expr_list',)
 
-        self.lineno = lineno
-        self.column = column
+    def __init__(self, lineno, column):
+        super().__init__(lineno, column)
 
         self.expr_list = []
 
-    def __str__(self):
+    def parts(self):
+        # A block with a single expression is printed as
+        # this expression
         if len(self.expr_list) == 1:
-            return str(self.expr_list[0])
-        else:
-            output = '['
+            return [self.expr_list[0]]
 
-            for i, e in enumerate(self.expr_list):
-                if i == 0:
-                    output += str(e)
-                else:
-                    output += ', ' + str(e)
+        output = ['[']
 
-            output += ']'
+        for i, e in enumerate(self.expr_list):
+            if i != 0:
+                output.append(', ')
+
+            output.append(e)
 
-            if self.expr_type is not None:
-                output += ' : ' + self.expr_type
+        output.append(']')
 
-            return output
+        return self.typed(output)
 
     def add_expr(self, e):
         self.expr_list.append(e)
+
+
+###########
+# Visitor #
+###########
+
+class Visitor:
+    """
+    Parent class of the passes over the AST (semantic analysis,
+    code generation, ...).
+
+    A pass defines a method '<prefix><NodeClass>' (e.g.
+    'codegen_If') for each kind of node it handles. Instead of
+    formatting this name and calling 'getattr' for each visited
+    node, the method of each node class is looked up once per
+    pass class (dispatch table) and bound once per pass, so that
+    the dispatch of a node is a single dictionary lookup on its
+    class.
+    """
+
+    # Prefix of the methods handling the nodes
+    prefix = 'visit_'
+
+    # Dispatch tables (node class -> function) of each pass class
+    dispatch_tables = {}
+
+    def __init__(self):
+        # We bind the functions of the dispatch table to the pass
+        self.dispatch_table = {
+            node_class: function.__get__(self)
+            for node_class, function in self.get_dispatch_table().items()
+        }
+
+    @classmethod
+    def get_dispatch_table(cls):
+        """
+        Returns the dispatch table of the pass class (built the
+        first time it is needed).
+        """
+
+        table = Visitor.dispatch_tables.get(cls)
+
+        if table is None:
+            table = {}
+
+            # We look for a method for each node class
+            node_classes = [Node]
+
+            while node_classes:
+                node_class = node_classes.pop()
+                node_classes.extend(node_class.__subclasses__())
+
+                function = getattr(cls, cls.prefix + node_class.__name__, None)
+
+                if function is not None:
+                    table[node_class] = function
+
+            Visitor.dispatch_tables[cls] = table
+
+        return table
+
+    def visit(self, node, *args):
+        return self.dispatch_table[node.__class__](node, *args)
+
+
+###########
+# Printer #
+###########
+
+class Printer:
+    """
+    Writes an AST on a stream. The AST is traversed iteratively,
+    with an explicit stack instead of recursive calls (so that
+    deeply nested expressions do not reach the recursion limit of
+    Python), and the output is written by chunks.
+
+    Two formats are available : the format of the brief ('text')
+    and a compact machine-readable format ('jsonl', the AST as a
+    JSON document on a single line, each element being an object
+    with its kind, its position and its attributes).
+    """
+
+    # Number of parts written at once on the stream
+    chunk_size = 8192
+
+    # Attributes written in the 'jsonl' format (one list per
+    # element class)
+    json_attributes = {}
+
+    ###############
+    # Constructor #
+    ###############
+
+    def __init__(self, stream):
+        # We save the output stream
+        self.stream = stream
+
+    ###################
+    # Use the printer #
+    ###################
+
+    def write(self, node, dump_format='text'):
+        """
+        Writes the AST 'node' on the stream, in the format
+        'dump_format'.
+        """
+
+        if dump_format == 'jsonl':
+            expand = self.json_parts
+        else:
+            expand = self.text_parts
+
+        # Stack of the parts to write (in reverse order), a node
+        # is replaced by its own parts
+        stack = [node]
+        chunk = []
+
+        while stack:
+            part = stack.pop()
+
+            if isinstance(part, str):
+                chunk.append(part)
+
+                if len(chunk) == self.chunk_size:
+                    self.stream.write(''.join(chunk))
+                    chunk = []
+            else:
+                parts = expand(part)
+                parts.reverse()
+
+                stack.extend(parts)
+
+        self.stream.write(''.join(chunk))
+
+    def text_parts(self, node):
+        """
+        Returns the parts of the textual representation of the
+        element 'node' (an element left empty by the parser, e.g.
+        after a trailing comma in a list, is written 'None').
+        """
+
+        if node is None:
+            return ['None']
+
+        return node.parts()
+
+    def json_parts(self, node):
+        """
+        Returns the parts of the JSON representation of the
+        element 'node' (an empty element is written 'null').
+        """
+
+        if node is None:
+            return ['null']
+
+        node_class = node.__class__
+        attributes = Printer.json_attributes.get(node_class)
+
+        # We get the attributes of the element class (all the
+        # slots of its classes, except the position)
+        if attributes is None:
+            attributes = []
+
+            for c in reversed(node_class.__mro__):
+                for attribute in c.__dict__.get('__slots__', ()):
+                    if attribute != 'position':
+                        attributes.append(attribute)
+
+            Printer.json_attributes[node_class] = attributes
+
+        # We create the parts of the element
+        output = ['{"node":"' + node_class.__name__ + '"']
+
+        if hasattr(node, 'position'):
+            output.append(',"line":{},"column":{}'.format(node.lineno, node.column))
+
+        for attribute in attributes:
+            value = getattr(node, attribute)
+
+            output.append(',"' + attribute + '":')
+
+            if isinstance(value, list):
+                output.append('[')
+
+                for i, e in enumerate(value):
+                    if i != 0:
+                        output.append(',')
+
+                    output.append(e if isinstance(e, Node) else json.dumps(e))
+
+                output.append(']')
+            elif isinstance(value, Node):
+                output.append(value)
+            else:
+                output.append(json.dumps(value))
+
+        output.append('}')
+
+        return output
@@ -27,25 +27,20 @@ class Parser:
     # Constructor #
     ###############
 
-    def __init__(self, filename, lexer):
-        # We save the filename (to print error)
-        self.filename = filename
+    def __init__(self, source, lexer):
+        # We save the source and its name (to print error)
+        self.source = source
+        self.filename = source.name
 
-        # We get the file content
-        with open(filename, 'r', encoding='ascii') as f:
-            data = f.read()
-
-        # We save the file content (to retrieve column of tokens)
-        self.data = data
-
-        # We save the argument values
-        self.lexer = lexer.lexer
+        # We save the argument values (the lexer gives to the
+        # parser the tokens it has already produced)
+        self.lexer = lexer
 
         # We get the token list
         self.tokens = lexer.tokens
 
         # Build the parser
-        self.parser = yacc.yacc(module=self, debug=False, errorlog=yacc.NullLogger(), tabmodule='parsetab')
+        self.build()
 
     ####################
     # Precedence rules #
@@ -71,13 +66,18 @@ class Parser:
     # Remark : each rule is written in the docstring of the
     # corresponding function
 
+    # Remark : the rules of the sequences (classes, class body,
+    # formals, block and args) are left recursive, so that each
+    # element is appended to the list of the previous elements
+    # (the list is built in linear time)
+
     def p_program(self, p):
         """
-        program : class program
+        program : program class
                 | class
         """
 
-        self.ast.add_class(p[1])
+        self.ast.add_class(p[len(p) - 1])
 
     def p_class(self, p):
         """
@@ -151,8 +151,8 @@ class Parser:
 
     def p_class_body_aux(self, p):
         """
-        class_body_aux : field class_body_aux
-                       | method class_body_aux
+        class_body_aux : class_body_aux field
+                       | class_body_aux method
                        | field
                        | method
         """
@@ -162,7 +162,8 @@ class Parser:
 
         # If there is multiple elements
         if len(p) > 2:
-            p[0] = [p[1]] + p[2]
+            p[0] = p[1]
+            p[0].append(p[2])
 
         # If there is only one element
         else:
@@ -230,15 +231,36 @@ class Parser:
     def p_formals(self, p):
         """
         formals : empty
-                | formal
-                | formal COMMA formals
+                | formals_aux
+                | formals_aux COMMA
         """
 
-        # We always return a list with all formals
+        # We always return a list with all formals (remark :
+        # an empty element follows a trailing comma)
+
+        # If there is a trailing comma
+        if len(p) > 2:
+            p[0] = p[1]
+            p[0].append(None)
+
+        # If there is no formal
+        elif p[1] is None:
+            p[0] = [None]
+
+        # If there is at least an element
+        else:
+            p[0] = p[1]
+
+    def p_formals_aux(self, p):
+        """
+        formals_aux : formals_aux COMMA formal
+                    | formal
+        """
 
         # If there is multiple elements
         if len(p) > 2:
-            p[0] = [p[1]] + p[3]
+            p[0] = p[1]
+            p[0].append(p[3])
 
         # If there is only one element
         else:
@@ -276,19 +298,13 @@ class Parser:
         # We add the required expression to the block
         p[0].add_expr(p[2])
 
-        # We check if there is other expressions
-        if p[3] is not None:
-
-            # We iterate over the expression list
-            for e in p[3]:
-
-                # If expression is not empty, we add it
-                if e is not None:
-                    p[0].add_expr(e)
+        # We add the other expressions
+        for e in p[3]:
+            p[0].add_expr(e)
 
     def p_block_aux(self, p):
         """
-        block_aux : SEMICOLON expr block_aux
+        block_aux : block_aux SEMICOLON expr
                   | empty
         """
 
@@ -296,14 +312,12 @@ class Parser:
 
         # If there is at least an element
         if len(p) > 2:
+            p[0] = p[1]
+            p[0].append(p[3])
 
-            # If there multiple elements
-            if p[3] is not None:
-                p[0] = [p[2]] + p[3]
-
-            # If there is only one element
-            else:
-                p[0] = [p[2]]
+        # If there is no element
+        else:
+            p[0] = []
 
     def p_expr_if(self, p):
         """
@@ -507,15 +521,36 @@ class Parser:
     def p_args(self, p):
         """
         args : empty
-             | expr
-             | expr COMMA args
+             | args_aux
+             | args_aux COMMA
         """
 
-        # We always return a list with all args
+        # We always return a list with all args (remark :
+        # an empty element follows a trailing comma)
+
+        # If there is a trailing comma
+        if len(p) > 2:
+            p[0] = p[1]
+            p[0].append(None)
+
+        # If there is no arg
+        elif p[1] is None:
+            p[0] = [None]
+
+        # If there is at least an element
+        else:
+            p[0] = p[1]
+
+    def p_args_aux(self, p):
+        """
+        args_aux : args_aux COMMA expr
+                 | expr
+        """
 
         # If there is multiple elements
         if len(p) > 2:
-            p[0] = [p[1]] + p[3]
+            p[0] = p[1]
+            p[0].append(p[3])
 
         # If there is only one element
         else:
@@ -612,20 +647,45 @@ class Parser:
         the beginning of the file.
         """
 
-        line_start = self.data.rfind('\n', 0, lexpos) + 1
-
-        return (lexpos - line_start) + 1
+        return self.source.line_index.find_column(lexpos)
 
     ##################
     # Use the parser #
     ##################
 
+    # Table module of the parser
+    tabmodule = 'parsetab'
+
+    # Parsers built (one per parser class), see 'build'
+    built_parsers = {}
+
+    def build(self):
+        # The parser (and its tables) is built only once per
+        # parser class
+        parser = Parser.built_parsers.get(self.__class__)
+
+        if parser is None:
+            parser = yacc.yacc(module=self, debug=False, errorlog=yacc.NullLogger(), tabmodule=self.tabmodule)
+            Parser.built_parsers[self.__class__] = parser
+        else:
+            # We attach the grammar rules and the error function
+            # of the built parser to this object
+            rules = {p.func: getattr(self, p.func) for p in parser.productions if p.func}
+
+            for p in parser.productions:
+                p.bind(rules)
+
+            parser.errorfunc = self.p_error
+
+        self.parser = parser
+
     def parse(self):
         # We instantiate the abstract syntax tree
         self.ast = Program()
 
-        # We parse the content of the file
-        self.parser.parse(input=self.data, lexer=self.lexer)
+        # We parse the content of the file (the tokens are read
+        # from the lexer, the file is not tokenized again)
+        self.parser.parse(lexer=self.lexer)
 
         # We return the AST
         return self.ast
@@ -636,12 +696,9 @@ class ParserExt(Parser):
     # Constructor #
     ###############
 
-    def __init__(self, filename, lexer):
+    def __init__(self, source, lexer):
         # We call the constructor of the parent class
-        super().__init__(filename, lexer)
-
-        # Build the parser
-        self.parser = yacc.yacc(module=self, debug=False, errorlog=yacc.NullLogger(), tabmodule='parsetabext')
+        super().__init__(source, lexer)
 
     ####################
     # Precedence rules #
@@ -727,3 +784,11 @@ class ParserExt(Parser):
 
         # Create the literal
         p[0] = Literal(lineno, column, p[1], 'double')
+
+    ##################
+    # Use the parser #
+    ##################
+
+    # Overriden element
+
+    tabmodule = 'parsetabext'
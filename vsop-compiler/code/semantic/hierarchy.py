@@ -0,0 +1,128 @@
+"""
+INFO0085-1 - Compilers
+University of Liege
+Academic year 2019-2020
+
+Authors :
+    - Maxime Meurisse
+    - Valentin Vermeylen
+"""
+
+
+###########
+# Classes #
+###########
+
+class ClassHierarchy:
+    """
+    Index of the class hierarchy of a program, built once (after
+    the classes have been checked) to answer the conformance
+    queries of the semantic analysis quickly.
+
+    Each class gets its parent, its depth and the interval of its
+    subtree in a depth-first traversal of the hierarchy (a class
+    conforms to another one if its interval is included in the
+    interval of the other one). The common ancestor of two classes
+    is found with jump pointers (the 2^k-th ancestor of each class).
+    """
+
+    ###############
+    # Constructor #
+    ###############
+
+    def __init__(self, st, root='Object'):
+        # Parent of each class
+        self.parent = {root: None}
+
+        for name, value in st.items():
+            if name != root:
+                self.parent[name] = value.parent[0]
+
+        # Children of each class (in the order of the program)
+        children = {name: [] for name in self.parent}
+
+        for name, parent in self.parent.items():
+            if parent is not None:
+                children[parent].append(name)
+
+        # Depth of each class, interval of its subtree and order of
+        # the classes in the traversal (a class after its parent)
+        self.depth = {root: 0}
+        self.enter = {}
+        self.exit = {}
+        self.order = []
+
+        # We traverse the hierarchy with an explicit stack (the
+        # second element tells if the subtree is done)
+        counter = 0
+        stack = [(root, False)]
+
+        while stack:
+            name, done = stack.pop()
+
+            if done:
+                self.exit[name] = counter
+            else:
+                self.enter[name] = counter
+                self.order.append(name)
+                counter += 1
+
+                stack.append((name, True))
+
+                for child in reversed(children[name]):
+                    self.depth[child] = self.depth[name] + 1
+                    stack.append((child, False))
+
+        # Jump pointers of each class (the k-th element is the
+        # 2^k-th ancestor of the class, the root is its own
+        # ancestor)
+        self.jumps = {name: [parent if parent is not None else root] for name, parent in self.parent.items()}
+
+        k = 0
+        max_depth = max(self.depth.values())
+
+        while (1 << (k + 1)) <= max_depth:
+            for name in self.jumps:
+                jumps = self.jumps[name]
+                jumps.append(self.jumps[jumps[k]][k])
+
+            k += 1
+
+    ###########
+    # Queries #
+    ###########
+
+    def is_subtype(self, class_name_1, class_name_2):
+        """
+        Returns True if the class 'class_name_1' conforms to the
+        class 'class_name_2' (i.e. is the class itself or one of
+        its descendants), False otherwise (or if one of them is
+        not a class).
+        """
+
+        if class_name_1 not in self.enter or class_name_2 not in self.enter:
+            return False
+
+        return self.enter[class_name_2] <= self.enter[class_name_1] and self.exit[class_name_1] <= self.exit[class_name_2]
+
+    def get_common_ancestor(self, class_name_1, class_name_2):
+        """
+        Returns the least common ancestor of the classes
+        'class_name_1' and 'class_name_2'.
+        """
+
+        if self.is_subtype(class_name_2, class_name_1):
+            return class_name_1
+
+        if self.is_subtype(class_name_1, class_name_2):
+            return class_name_2
+
+        # We go up from the first class, as far as possible
+        # without reaching an ancestor of the second class
+        for k in reversed(range(len(self.jumps[class_name_1]))):
+            ancestor = self.jumps[class_name_1][k]
+
+            if not self.is_subtype(class_name_2, ancestor):
+                class_name_1 = ancestor
+
+        return self.parent[class_name_1]
@@ -14,22 +14,29 @@ Authors :
 
 import sys
 
+from types import GeneratorType
+
 from parser.ast import *
 from semantic.tables import *
+from semantic.hierarchy import ClassHierarchy
 
 
 ###########
 # Classes #
 ###########
 
-class Semantic:
+class Semantic(Visitor):
     ###############
     # Constructor #
     ###############
 
-    def __init__(self, filename, ast):
-        # We save the VSOP source file name
-        self.filename = filename
+    def __init__(self, source, ast):
+        # We build the dispatch table of the expressions
+        super().__init__()
+
+        # We save the VSOP source and its name
+        self.source = source
+        self.filename = source.name
 
         # We save the AST to annotate it later
         self.ast = ast
@@ -38,6 +45,10 @@ class Semantic:
         # the symbol tables of the classes
         self.st = {}
 
+        # Index of the class hierarchy (built once the classes
+        # are checked)
+        self.hierarchy = None
+
         # We define the list of primitive types
         self.primitive_types = ['unit', 'bool', 'int32', 'string']
 
@@ -45,14 +56,17 @@ class Semantic:
     # Error handling #
     ##################
 
-    def print_error(self, lineno, column, message):
+    def print_error(self, lineno, column, message, fatal=True):
         """
         Prints an error on stderr in the right format
-        and exits the parser.
+        and exits the parser (unless 'fatal' is False,
+        e.g. to report several errors at once).
         """
 
         print('{}:{}:{}: semantic error: {}'.format(self.filename, lineno, column, message), file=sys.stderr)
-        sys.exit(1)
+
+        if fatal:
+            sys.exit(1)
 
     ######################
     # Classes management #
@@ -92,53 +106,68 @@ class Semantic:
             else:
                 self.st[c.name].parent = (c.parent, self.st[c.parent])
 
-        # Check possible cycles
-        for key, value in self.st.items():
-            if key != 'Object':
-                parent = value.parent[0]
-                key_list = [key, parent]
+        # Check possible cycles (every class that does not inherit
+        # from 'Object' is reported)
+        cyclic = self.find_cycles()
 
-                while parent != 'Object':
-                    c = parent
-                    parent = self.st[c].parent[0]
+        for key in cyclic:
+            value = self.st[key]
 
-                    if parent in key_list:
-                        self.print_error(value.lineno, value.column, 'class "{}" can not be extend in a cycle'.format(key))
-                    else:
-                        key_list += [parent]
+            self.print_error(value.lineno, value.column, 'class "{}" can not be extend in a cycle'.format(key), False)
+
+        if cyclic:
+            sys.exit(1)
 
         # Check that a 'Main' class is provided
         if 'Main' not in self.st:
             self.print_error(1, 1, 'a class "Main" must be provided')
 
-    def get_ancestors(self, class_name):
-        ancestors = []
+        # We index the class hierarchy (for the conformance checks)
+        self.hierarchy = ClassHierarchy(self.st)
 
-        if class_name != 'Object':
-            ancestors += [class_name]
-            parent = self.st[class_name].parent
+    def find_cycles(self):
+        """
+        Returns the list of the classes (in the order of the
+        program) that are in an inheritance cycle or inherit
+        from a class in a cycle.
+
+        Each class is visited once : we follow the parents of a
+        class until a class already visited is reached (if it
+        is on the current path, the path ends in a cycle) and
+        all the classes of the path get the same result.
+        """
 
-            while parent is not None:
-                ancestors += [parent[0]]
-                parent = self.st[parent[0]].parent
+        # Result of each visited class (True if it inherits
+        # from 'Object')
+        valid = {'Object': True}
 
-        return ancestors
+        for key in self.st:
+            # We follow the parents until a visited class
+            path = []
+            on_path = set()
 
-    def get_common_ancestor(self, class_name_1, class_name_2):
-        class_1_ancestors = self.get_ancestors(class_name_1)
-        class_2_ancestors = self.get_ancestors(class_name_2)
+            c = key
 
-        common = [ancestors for ancestors in class_1_ancestors if ancestors in class_2_ancestors]
+            while c not in valid and c not in on_path:
+                path.append(c)
+                on_path.add(c)
 
-        return common[0]
+                c = self.st[c].parent[0]
 
-    def get_current_class(self, stack):
-        # We iterate over each element of the stack
-        for symbol_table in stack:
+            # If the path ends in a cycle (or in a class that
+            # inherits from a cycle), the classes of the path
+            # do not inherit from 'Object'
+            result = c not in on_path and valid[c]
 
-            # We only look for 'ClassSymbolTable'
-            if symbol_table.__class__.__name__ == 'ClassSymbolTable':
-                return symbol_table.name
+            for c in path:
+                valid[c] = result
+
+        return [key for key in self.st if not valid[key]]
+
+    def get_current_class(self, stack):
+        # We get the class of the scope (if any)
+        if stack.class_table is not None:
+            return stack.class_table.name
 
         return None
 
@@ -196,9 +225,9 @@ class Semantic:
                 # We check if the field has an initialize
                 if f.init_expr is not None:
 
-                    # We get the type of the initializing expression (with an empty stack because
+                    # We get the type of the initializing expression (with an empty scope because
                     # fields and methods of 'self' are not yet in the scope)
-                    init_type = self.analyze_expr(f.init_expr, [])
+                    init_type = self.analyze_expr(f.init_expr, Scope())
 
                     # If the expected field type is a primitive type
                     if f.type in self.primitive_types:
@@ -208,25 +237,21 @@ class Semantic:
                     # If the expected field type is a 'class' type
                     else:
                         if f.type != init_type:
-                            init_ancestors = self.get_ancestors(init_type)
-
-                            if f.type not in init_ancestors:
+                            if not self.hierarchy.is_subtype(init_type, f.type):
                                 self.print_error(f.init_expr.lineno, f.init_expr.column, 'type of the initial expression is not conform with static type "{}"'.format(f.type))
 
                             # We update the type of the field (because we will use the dynamic type of the field to check 'Call')
                             self.st[c.name].fields[f.name].type = init_type
 
     def lookup_field(self, stack, field_name):
-        # We iterate over each symbol table on the stack
-        for symbol_table in stack:
+        # We search for the field in the local names of the scope
+        field = stack.lookup(field_name)
 
-            # We search for the field in each symbol table
-            field = symbol_table.lookup_field(field_name)
+        # If not found, we search for it in the current class
+        if field is None and stack.class_table is not None:
+            field = stack.class_table.lookup_field(field_name)
 
-            if field is not None:
-                return field
-
-        return None
+        return field
 
     ######################
     # Methods management #
@@ -300,9 +325,7 @@ class Semantic:
                                 # If argument type is a 'class' type
                                 else:
                                     if signature_args_type[i] != args_type[i]:
-                                        arg_ancestors = self.get_ancestors(args_type[i])
-
-                                        if signature_args_type[i] not in arg_ancestors:
+                                        if not self.hierarchy.is_subtype(args_type[i], signature_args_type[i]):
                                             self.print_error(m.lineno, m.column, 'formals of method "{}" must have the same type of formals of method "{}" in parent class at {}:{}'.format(m.name, m.name, parent_method.lineno, parent_method.column))
 
                             # If return types are different
@@ -344,7 +367,7 @@ class Semantic:
                 ret_type = m.ret_type
 
                 # We get the type of the method's body
-                stack = [self.st[c.name].methods[m.name], self.st[c.name]]
+                stack = Scope(self.st[c.name].methods[m.name].args, self.st[c.name])
                 block_type = self.analyze_expr(m.block, stack)
 
                 # If the expected return type is a primitive type
@@ -361,63 +384,90 @@ class Semantic:
 
                     # If the return type of the block is a 'class' type
                     elif ret_type != block_type:
-                        block_type_ancestors = self.get_ancestors(block_type)
-
-                        if ret_type not in block_type_ancestors:
+                        if not self.hierarchy.is_subtype(block_type, ret_type):
                             self.print_error(m.block.lineno, m.block.column, 'return type of the method "{}" is not conform with his signature'.format(m.name))
 
-    def lookup_method(self, stack, method_name):
-        # We iterate over each symbol table on the stack
-        for symbol_table in stack:
-
-            # We search for the method in each symbol table
-            method = symbol_table.lookup_method(method_name)
-
-            if method is not None:
-                return method
-
-        return method
-
     ##########################
     # Expressions management #
     ##########################
 
+    # Prefix of the methods analyzing the expressions (see
+    # 'Visitor' class)
+    prefix = 'analyze_expr_'
+
     def analyze_expr(self, expr, stack):
-        # We get the expression class (If, While, ...)
-        expr_class = expr.__class__.__name__
+        """
+        Analyzes the expression 'expr' (in the scope 'stack'),
+        annotates it and returns its type.
+
+        The methods analyzing an expression with sub-expressions
+        are generators : they yield each sub-expression (with its
+        scope) and receive its type. The sub-expressions are thus
+        analyzed with an explicit stack of generators instead of
+        recursive calls, so that the nesting of the expressions is
+        not limited by the recursion limit of Python.
+        """
+
+        # Stack of the expressions being analyzed (with the
+        # generator analyzing each of them)
+        pending = []
 
         # We analyze the expression depending of his type (class)
-        if expr_class == 'Block':
-            for i in range(0, len(expr.expr_list) - 1):
-                self.analyze_expr(expr.expr_list[i], stack)
+        result = self.dispatch_table[expr.__class__](expr, stack)
+
+        while True:
+            # If the expression has sub-expressions, we start
+            # its analysis
+            if isinstance(result, GeneratorType):
+                pending.append((expr, result))
+                expr_type = None
+
+            # Else, we set the expression type (we update the node
+            # in the AST) and we give it to the expression waiting
+            # for it (if any)
+            else:
+                expr.expr_type = result
 
-            expr_type = self.analyze_expr(expr.expr_list[len(expr.expr_list) - 1], stack)
-        else:
-            method_name = 'analyze_expr_{}'.format(expr_class)
-            expr_type = getattr(self, method_name)(expr, stack)
+                if not pending:
+                    return result
 
-        # We set the expression type (we update the node in the AST)
-        expr.expr_type = expr_type
+                expr_type = result
 
-        # We return the type of the expression
-        return expr_type
+            # We resume the analysis of the last pending expression
+            expr, analysis = pending[-1]
+
+            try:
+                expr, stack = analysis.send(expr_type)
+            except StopIteration as e:
+                pending.pop()
+                result = e.value
+            else:
+                result = self.dispatch_table[expr.__class__](expr, stack)
+
+    def analyze_expr_Block(self, expr, stack):
+        # We analyze each expression of the block
+        for i in range(0, len(expr.expr_list) - 1):
+            yield expr.expr_list[i], stack
+
+        # The type of the block is the type of its last expression
+        return (yield expr.expr_list[len(expr.expr_list) - 1], stack)
 
     def analyze_expr_If(self, expr, stack):
         # We get the type of the conditional expression
-        cond_type = self.analyze_expr(expr.cond_expr, stack)
+        cond_type = yield expr.cond_expr, stack
 
         # We check the type of the conditional expression
         if cond_type != 'bool':
             self.print_error(expr.cond_expr.lineno, expr.cond_expr.column, 'conditional expression must be of type "bool"')
 
         # We get the type of the 'then' branch
-        then_type = self.analyze_expr(expr.then_expr, stack)
+        then_type = yield expr.then_expr, stack
         ret_type = then_type
 
         # If there is a 'else' branch, we analyze it
         if expr.else_expr is not None:
             # We get the type of the 'else' branch
-            else_type = self.analyze_expr(expr.else_expr, stack)
+            else_type = yield expr.else_expr, stack
 
         # Else, by default the type of the branch 'else' is 'unit'
         else:
@@ -439,21 +489,21 @@ class Semantic:
             if then_type != else_type:
                 # We get the common ancestor between the two classes (no verification
                 # needed because every classes have at least a common ancestor : Object)
-                ret_type = self.get_common_ancestor(then_type, else_type)
+                ret_type = self.hierarchy.get_common_ancestor(then_type, else_type)
 
         # We return the type of the expression
         return ret_type
 
     def analyze_expr_While(self, expr, stack):
         # We get the type of the conditional expression
-        cond_type = self.analyze_expr(expr.cond_expr, stack)
+        cond_type = yield expr.cond_expr, stack
 
         # We check the type of the conditional expression
         if cond_type != 'bool':
             self.print_error(expr.cond_expr.lineno, expr.cond_expr.column, 'conditional expression must be of type "bool"')
 
         # We get the type of the body
-        body_type = self.analyze_expr(expr.body_expr, stack)
+        body_type = yield expr.body_expr, stack
 
         # We return the type of the expression
         return 'unit'
@@ -464,12 +514,12 @@ class Semantic:
             if expr.type not in self.st:
                 self.print_error(expr.lineno, expr.column, 'undefined type "{}"'.format(expr.type))
 
-        # Create the symbol table of the 'let'
-        let_symbol_table = LetSymbolTable(expr.lineno, expr.column, expr.name, expr.type)
+        # Create the symbol table of the field defined by the 'let'
+        let_symbol_table = FieldSymbolTable(expr.lineno, expr.column, expr.name, expr.type)
 
         # If the 'let' has an initializing expression
         if expr.init_expr is not None:
-            init_type = self.analyze_expr(expr.init_expr, stack)
+            init_type = yield expr.init_expr, stack
 
             # If the initial type is a primitive type
             if init_type in self.primitive_types:
@@ -479,13 +529,14 @@ class Semantic:
             # If the initial type is a 'class' type
             else:
                 if expr.type != init_type:
-                    init_ancestors = self.get_ancestors(init_type)
-
-                    if expr.type not in init_ancestors:
+                    if not self.hierarchy.is_subtype(init_type, expr.type):
                         self.print_error(expr.init_expr.lineno, expr.init_expr.column, 'type of initial expression must be conform with type "{}"'.format(expr.type))
 
-        # Get the expression of the body of the 'let'
-        body_type = self.analyze_expr(expr.scope_expr, [let_symbol_table] + stack)
+        # Get the expression of the body of the 'let' (the field is
+        # only in the scope of the body)
+        stack.push(expr.name, let_symbol_table)
+        body_type = yield expr.scope_expr, stack
+        stack.pop()
 
         # We return the type of the 'let'
         return body_type
@@ -503,7 +554,7 @@ class Semantic:
             self.print_error(expr.lineno, expr.column, 'no field named "{}" available in this scope'.format(expr.name))
 
         # We get the type of the expression we assign
-        assign_type = self.analyze_expr(expr.expr, stack)
+        assign_type = yield expr.expr, stack
 
         # If one type is a primitive type
         if field.type in self.primitive_types or assign_type in self.primitive_types:
@@ -514,11 +565,8 @@ class Semantic:
 
         # If field type is a 'class' type
         else:
-            # We get the ancestors of the assigned type
-            assign_ancestors = self.get_ancestors(assign_type)
-
             # We check if the field is a parent of the assigned type
-            if field.type != assign_type and field.type not in assign_ancestors:
+            if field.type != assign_type and not self.hierarchy.is_subtype(assign_type, field.type):
                 self.print_error(expr.expr.lineno, expr.expr.column, 'non conform assigned type "{}"'.format(assign_type))
 
         # We return the type of the expression
@@ -526,7 +574,7 @@ class Semantic:
 
     def analyze_expr_UnOp(self, expr, stack):
         # We get the type of the expression
-        expr_type = self.analyze_expr(expr.expr, stack)
+        expr_type = yield expr.expr, stack
 
         # We get the unary operator
         unop = expr.op
@@ -560,8 +608,8 @@ class Semantic:
 
     def analyze_expr_BinOp(self, expr, stack):
         # We get type of left and right expressions
-        left_type = self.analyze_expr(expr.left_expr, stack)
-        right_type = self.analyze_expr(expr.right_expr, stack)
+        left_type = yield expr.left_expr, stack
+        right_type = yield expr.right_expr, stack
 
         # We get the binary operator
         binop = expr.op
@@ -615,7 +663,7 @@ class Semantic:
 
     def analyze_expr_Call(self, expr, stack):
         # We get the type of the 'caller'
-        obj_type = self.analyze_expr(expr.obj_expr, stack)
+        obj_type = yield expr.obj_expr, stack
 
         # We check if the type of the 'caller' is 'None'
         if obj_type is None:
@@ -626,7 +674,7 @@ class Semantic:
             self.print_error(expr.obj_expr.lineno, expr.obj_expr.column, 'the caller can not have a primitive type')
 
         # We check if the method is available in the scope of the caller
-        method = self.lookup_method([self.st[obj_type]], expr.method_name)
+        method = self.st[obj_type].lookup_method(expr.method_name)
 
         if method is None:
             self.print_error(expr.lineno, expr.column, 'no method called "{}" available in this scope'.format(expr.method_name))
@@ -635,7 +683,7 @@ class Semantic:
         args_type = []
 
         for e in expr.expr_list:
-            arg_type = self.analyze_expr(e, stack)
+            arg_type = yield e, stack
             args_type += [arg_type]
 
         if len(method.args) != len(args_type):
@@ -656,9 +704,7 @@ class Semantic:
                 # If the type of the argument is a 'class' type
                 else:
                     if signature_args_type[i] != args_type[i]:
-                        arg_ancestors = self.get_ancestors(args_type[i])
-
-                        if signature_args_type[i] not in arg_ancestors:
+                        if not self.hierarchy.is_subtype(args_type[i], signature_args_type[i]):
                             self.print_error(expr.expr_list[i].lineno, expr.expr_list[i].column, 'argument number {} does not have a conform type'.format(i + 1))
 
         # We return the type of the expression
@@ -751,6 +797,11 @@ class Semantic:
         # Get and check methods of each class
         self.check_methods()
 
+        # Flatten the members of each class (a class after its
+        # parent)
+        for name in self.hierarchy.order:
+            self.st[name].finalize()
+
         ###############
         # Expressions #
         ###############
@@ -773,9 +824,9 @@ class SemanticExt(Semantic):
     # Constructor #
     ###############
 
-    def __init__(self, filename, ast):
+    def __init__(self, source, ast):
         # We call the constructor of the parent class
-        super().__init__(filename, ast)
+        super().__init__(source, ast)
 
         # We define the list of primitive types
         self.primitive_types = ['unit', 'bool', 'int32', 'string', 'double']
@@ -788,7 +839,7 @@ class SemanticExt(Semantic):
 
     def analyze_expr_UnOp(self, expr, stack):
         # We get the type of the expression
-        expr_type = self.analyze_expr(expr.expr, stack)
+        expr_type = yield expr.expr, stack
 
         # We get the unary operator
         unop = expr.op
@@ -822,8 +873,8 @@ class SemanticExt(Semantic):
 
     def analyze_expr_BinOp(self, expr, stack):
         # We get type of left and right expressions
-        left_type = self.analyze_expr(expr.left_expr, stack)
-        right_type = self.analyze_expr(expr.right_expr, stack)
+        left_type = yield expr.left_expr, stack
+        right_type = yield expr.right_expr, stack
 
         # We get the binary operator
         binop = expr.op
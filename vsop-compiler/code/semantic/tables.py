@@ -47,23 +47,39 @@ class ClassSymbolTable(SymbolTable):
         self.fields = {}
         self.methods = {}
 
+        # Flattened view of the fields and methods of the class
+        # (inherited ones included), see 'finalize'
+        self.all_fields = {}
+        self.all_methods = {}
+
+        self.finalized = False
+
+    def finalize(self):
+        """
+        Computes the flattened view of the fields and methods of
+        the class, the inherited ones included. It must be called
+        once all the members are known, the parent being finalized
+        first.
+        """
+
+        if self.parent is not None:
+            self.all_fields = dict(self.parent[1].all_fields)
+            self.all_methods = dict(self.parent[1].all_methods)
+
+        self.all_fields.update(self.fields)
+        self.all_methods.update(self.methods)
+
+        self.finalized = True
+
     def lookup_field(self, field_name):
-        if field_name in self.fields:
-            return self.fields[field_name]
-        else:
-            if self.parent is not None:
-                return self.parent[1].lookup_field(field_name)
+        assert self.finalized, 'class "{}" is not finalized'.format(self.name)
 
-        return None
+        return self.all_fields.get(field_name)
 
     def lookup_method(self, method_name):
-        if method_name in self.methods:
-            return self.methods[method_name]
-        else:
-            if self.parent is not None:
-                return self.parent[1].lookup_method(method_name)
+        assert self.finalized, 'class "{}" is not finalized'.format(self.name)
 
-        return None
+        return self.all_methods.get(method_name)
 
 
 class FieldSymbolTable(SymbolTable):
@@ -89,15 +105,41 @@ class MethodSymbolTable(SymbolTable):
         return None
 
 
-class LetSymbolTable(SymbolTable):
-    def __init__(self, lineno, column, field_name, _type):
-        super().__init__(lineno, column, 'let')
+class Scope:
+    """
+    Scope of an expression : the local names (arguments of the
+    method and names bound by the enclosing 'let') and the symbol
+    table of the current class (if any).
 
-        # Save field and his type defined by the let
-        self.field = {field_name: FieldSymbolTable(lineno, column, field_name, _type)}
+    The local names are kept in a single dictionary (the innermost
+    binding of each name), so that a name is found in one lookup.
+    A binding is added when entering a 'let' and removed when
+    leaving it, the shadowed bindings being restored from an undo
+    log.
+    """
 
-    def lookup_field(self, field_name):
-        if field_name in self.field:
-            return self.field[field_name]
+    def __init__(self, bindings=None, class_table=None):
+        # Innermost binding of each local name
+        self.bindings = dict(bindings) if bindings is not None else {}
 
-        return None
+        # Symbol table of the current class
+        self.class_table = class_table
+
+        # Previous binding of each name bound by 'push' (None if
+        # the name was not bound)
+        self.undo_log = []
+
+    def push(self, name, value):
+        self.undo_log.append((name, self.bindings.get(name)))
+        self.bindings[name] = value
+
+    def pop(self):
+        name, value = self.undo_log.pop()
+
+        if value is None:
+            del self.bindings[name]
+        else:
+            self.bindings[name] = value
+
+    def lookup(self, name):
+        return self.bindings.get(name)
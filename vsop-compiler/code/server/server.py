@@ -0,0 +1,223 @@
+"""
+INFO0085-1 - Compilers
+University of Liege
+Academic year 2019-2020
+
+Authors :
+    - Maxime Meurisse
+    - Valentin Vermeylen
+"""
+
+###########
+# Imports #
+###########
+
+import io
+import os
+import sys
+import json
+import socket
+import tempfile
+import traceback
+import socketserver
+
+
+#############
+# Functions #
+#############
+
+def run_captured(function, *args):
+    """
+    Calls 'function' with the arguments 'args' and returns the
+    exit status and the outputs (stdout and stderr) of the call.
+    An exit of the function (e.g. after an error) is caught and
+    gives its exit status.
+    """
+
+    # We capture the outputs of the call (the previous outputs
+    # are restored after the call)
+    outputs = sys.stdout, sys.stderr
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    sys.stdout, sys.stderr = stdout, stderr
+
+    try:
+        function(*args)
+        status = 0
+    except SystemExit as e:
+        if e.code is None:
+            status = 0
+        elif isinstance(e.code, int):
+            status = e.code
+        else:
+            print(e.code, file=stderr)
+            status = 1
+    except Exception:
+        traceback.print_exc(file=stderr)
+        status = 1
+    finally:
+        sys.stdout, sys.stderr = outputs
+
+    return {'status': status, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+
+###########
+# Classes #
+###########
+
+class ForkingUnixStreamServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """
+    Unix socket server handling each request in a child
+    process. The child inherits everything the server has
+    already loaded (modules, lexer and parser tables, ...)
+    and can modify it freely (e.g. exit on error) without
+    any effect on the next requests.
+    """
+
+    pass
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # We read the request (a single JSON line)
+        request = json.loads(self.rfile.readline().decode('utf8'))
+
+        # We compile the source file and send back the result
+        response = self.server.vsop_server.run(request['cwd'], request['argv'])
+
+        self.wfile.write((json.dumps(response) + '\n').encode('utf8'))
+
+
+class Server:
+    ###############
+    # Constructor #
+    ###############
+
+    def __init__(self, path, get_arg_parser, compile_source):
+        # We save the path of the Unix socket
+        self.path = path
+
+        # We save the functions used to parse the executable
+        # arguments and to compile the source file(s)
+        self.get_arg_parser = get_arg_parser
+        self.compile_source = compile_source
+
+    ###########
+    # Compile #
+    ###########
+
+    def run(self, cwd, argv):
+        """
+        Compiles a source file according to the executable
+        arguments 'argv' (as if the compiler was launched in
+        the directory 'cwd') and returns the exit status and
+        the outputs of the compilation.
+        """
+
+        def compile():
+            os.chdir(cwd)
+
+            # We parse the arguments of the client
+            arg_parser = self.get_arg_parser()
+            args = arg_parser.parse_args(argv)
+
+            if args.serve or not (args.source or args.batch):
+                arg_parser.error('the compiler server only accepts compilation requests')
+
+            if '-' in args.source:
+                arg_parser.error('the compiler server can not read the standard input of the client')
+
+            self.compile_source(args)
+
+        return run_captured(compile)
+
+    def warm_up(self):
+        """
+        Compiles a minimal program (VSOP and extended VSOP) to
+        a native executable, so that everything needed by a
+        compilation is loaded before the first request.
+        """
+
+        cwd = os.getcwd()
+
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ['warm_up.vsop', 'warm_up.vsopext']:
+                source = os.path.join(directory, name)
+
+                with open(source, 'w', encoding='ascii') as f:
+                    f.write('class Main { main() : int32 { 0 } }\n')
+
+                # The cache is bypassed, otherwise a cached program
+                # would be loaded without building anything
+                argv = ['--no-cache', source]
+
+                if name.endswith('.vsopext'):
+                    argv = ['-ext'] + argv
+
+                self.run(directory, argv)
+
+        os.chdir(cwd)
+
+    ##################
+    # Use the server #
+    ##################
+
+    def serve(self):
+        # We remove a possible socket left by a previous server
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        # We load everything needed by a compilation
+        self.warm_up()
+
+        # We serve requests until the server is interrupted
+        with ForkingUnixStreamServer(self.path, RequestHandler) as server:
+            server.vsop_server = self
+
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.unlink(self.path)
+
+
+class Client:
+    ###############
+    # Constructor #
+    ###############
+
+    def __init__(self, path):
+        # We save the path of the Unix socket of the server
+        self.path = path
+
+    ##################
+    # Use the client #
+    ##################
+
+    def compile(self, argv):
+        """
+        Sends a compilation request to the server, prints
+        its outputs and returns its exit status.
+        """
+
+        request = {'cwd': os.getcwd(), 'argv': argv}
+
+        # We send the request and wait for the response
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+                s.connect(self.path)
+                s.sendall((json.dumps(request) + '\n').encode('utf8'))
+
+                with s.makefile('rb') as f:
+                    response = json.loads(f.readline().decode('utf8'))
+        except (OSError, ValueError) as e:
+            print('main.py: error: can not reach the compiler server on "{}" ({})'.format(self.path, e), file=sys.stderr)
+
+            return 1
+
+        # We print the outputs of the compilation
+        sys.stdout.write(response['stdout'])
+        sys.stderr.write(response['stderr'])
+
+        return response['status']